@@ -41,6 +41,10 @@ def check_arm_compatibility(analysis_results):
         },
     }
 
+    # Bind frequently used containers once
+    recommendations = compatibility_result["recommendations"]
+    reasoning = compatibility_result["context"]["reasoning"]
+
     # Dictionary of available analyzers
     analyzers = {
         "terraform": {
@@ -63,21 +67,27 @@ def check_arm_compatibility(analysis_results):
         },
     }
 
+    # Compatible, incompatible and unknown item counts, tallied as results arrive
+    incompatible_count = compatible_count = unknown_count = 0
+
     # Dynamically run enabled analyzers
     for name, analyzer_config in analyzers.items():
         if analyzer_config["enabled"]:
             analyzer_results = analyzer_config["function"](
                 analysis_results.get(analyzer_config["input_key"], [])
             )
-            compatibility_result[analyzer_config["output_key"]] = analyzer_results[
-                analyzer_config["output_key"]
-            ]
-            compatibility_result["recommendations"].extend(
-                analyzer_results["recommendations"]
-            )
-            compatibility_result["context"]["reasoning"].extend(
-                analyzer_results["reasoning"]
-            )
+            items = analyzer_results[analyzer_config["output_key"]]
+            compatibility_result[analyzer_config["output_key"]] = items
+            for item in items:
+                compatible = item.get("compatible")
+                if compatible is False:
+                    incompatible_count += 1
+                elif compatible is True:
+                    compatible_count += 1
+                elif compatible == "unknown":
+                    unknown_count += 1
+            recommendations.extend(analyzer_results["recommendations"])
+            reasoning.extend(analyzer_results["reasoning"])
 
     # Determine overall compatibility
     if (
@@ -86,55 +96,31 @@ def check_arm_compatibility(analysis_results):
         and not compatibility_result["dependencies"]
     ):
         compatibility_result["overall_compatibility"] = "unknown"
-        compatibility_result["recommendations"].append(
+        recommendations.append(
             "No clear architecture-specific elements found. Manual verification recommended."
         )
-        compatibility_result["context"]["reasoning"].append(
+        reasoning.append(
             "No architecture-specific elements were identified in the analysis, making compatibility assessment uncertain."
         )
     else:
         # Check if there are any incompatible elements
-        has_incompatible = any(
-            item.get("compatible") is False
-            for category in ["instance_types", "docker_images", "dependencies"]
-            for item in compatibility_result[category]
-        )
-
-        if has_incompatible:
+        if incompatible_count:
             compatibility_result["overall_compatibility"] = "incompatible"
-            compatibility_result["context"]["reasoning"].append(
+            reasoning.append(
                 "Repository is marked as incompatible because one or more components explicitly conflict with ARM64 architecture."
             )
         else:
             compatibility_result["overall_compatibility"] = "compatible"
-            compatibility_result["context"]["reasoning"].append(
+            reasoning.append(
                 "Repository is likely compatible with ARM64 as no explicitly incompatible elements were found."
             )
 
     # Add summary statistics to context
     compatibility_result["context"]["statistics"] = {
-        "incompatible_items": sum(
-            1
-            for item in compatibility_result["instance_types"]
-            + compatibility_result["docker_images"]
-            + compatibility_result["dependencies"]
-            if item.get("compatible") is False
-        ),
-        "compatible_items": sum(
-            1
-            for item in compatibility_result["instance_types"]
-            + compatibility_result["docker_images"]
-            + compatibility_result["dependencies"]
-            if item.get("compatible") is True
-        ),
-        "unknown_items": sum(
-            1
-            for item in compatibility_result["instance_types"]
-            + compatibility_result["docker_images"]
-            + compatibility_result["dependencies"]
-            if item.get("compatible") == "unknown"
-        ),
-        "total_recommendations": len(compatibility_result["recommendations"]),
+        "incompatible_items": incompatible_count,
+        "compatible_items": compatible_count,
+        "unknown_items": unknown_count,
+        "total_recommendations": len(recommendations),
     }
 
     return compatibility_result
@@ -0,0 +1,39 @@
+"""
+PyPI ARM64 호환성 검사 예제 (실제 PyPI API를 호출함)
+
+사용법:
+    python examples/check_pypi.py
+"""
+
+import os
+import sys
+
+# 저장소 루트를 import 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analyze_tools.dependency_tools.package_compatibility import (
+    check_pypi_package_arm_compatibility,
+)
+from analyze_tools.dependency_tools.dependency_analyzer import (
+    analyze_requirements_with_pipgrip,
+)
+
+if __name__ == "__main__":
+    # rbloom 최신 버전 확인
+    result = check_pypi_package_arm_compatibility("rbloom")
+    print(result)
+
+    # 특정 버전 확인
+    result = check_pypi_package_arm_compatibility("pybloomfiltermmap3", "0.6.0")
+    print(result)
+
+    content = """
+    thrift
+    tensorflow-data-validation
+    """
+
+    # 의존성 분석 실행
+    dependency_analysis = analyze_requirements_with_pipgrip(content)
+
+    # 결과 출력
+    print(dependency_analysis)
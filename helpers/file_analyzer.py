@@ -1,27 +1,48 @@
 import re
 import json
 
+# Non-blank, non-comment requirement lines with any trailing comment stripped.
+# As in pip, "#" starts a comment only after whitespace, so URL fragments (#egg=...) are kept
+_REQ_LINE_RE = re.compile(
+    r"(?m)^[^\S\n]*(?!#)(\S(?:[^\n]*?\S)?)(?:[^\S\n]+#[^\n]*)?[^\S\n]*$"
+)
+
+# Architecture-specific resources or configurations, reported in this order
+ARCH_INDICATORS = ["architecture", "amd64", "x86_64", "arm64", "graviton"]
+
+# Instance type assignments
+_INSTANCE_TYPE_RE = re.compile(r'instance_type\s*=\s*"([^"]+)"')
+# Arch indicators, matched case-insensitively without lowercasing the content.
+# Scanned separately so indicators inside instance_type values are still found;
+# ASCII-only case folding matches the same text as content.lower()
+_ARCH_INDICATOR_RE = re.compile(
+    "|".join(map(re.escape, ARCH_INDICATORS)), re.IGNORECASE | re.ASCII
+)
+
 
 def extract_instance_types_from_terraform_file(content):
     """
     Analyze Terraform file content for instance types and other ARM64
     compatibility indicators.
+
+    >>> extract_instance_types_from_terraform_file(
+    ...     'instance_type = "${var.graviton_instance_type}"'
+    ... )["other_indicators"]
+    ['graviton']
     """
     results = {"instance_types": [], "other_indicators": []}
 
     # Look for AWS instance types in instance_type assignments
-    instance_type_pattern = r'instance_type\s*=\s*"([^"]+)"'
-    matches = re.findall(instance_type_pattern, content)
-
-    if matches:
-        results["instance_types"] = matches
+    results["instance_types"] = _INSTANCE_TYPE_RE.findall(content)
 
     # Look for architecture-specific resources or configurations
-    arch_indicators = ["architecture", "amd64", "x86_64", "arm64", "graviton"]
+    found_indicators = {
+        indicator.lower() for indicator in _ARCH_INDICATOR_RE.findall(content)
+    }
 
-    for indicator in arch_indicators:
-        if indicator in content.lower():
-            results["other_indicators"].append(indicator)
+    results["other_indicators"] = [
+        indicator for indicator in ARCH_INDICATORS if indicator in found_indicators
+    ]
 
     return results
 
@@ -58,10 +79,7 @@ def extract_dependencies(content, file_type):
 
     if file_type == "txt":  # requirements.txt
         # Extract package names and versions
-        for line in content.splitlines():
-            line = line.strip()
-            if line and not line.startswith("#"):
-                results["dependencies"].append(line)
+        results["dependencies"] = _REQ_LINE_RE.findall(content)
     elif file_type == "json":  # package.json
         # For package.json, we'll just store the content and let the analyzer handle it
         try:
@@ -72,11 +90,11 @@ def extract_dependencies(content, file_type):
             dev_deps = package_data.get("devDependencies", {})
 
             # Add all dependencies to the results
-            for name, version in deps.items():
-                results["dependencies"].append(f"{name}@{version}")
-
-            for name, version in dev_deps.items():
-                results["dependencies"].append(f"{name}@{version} (dev)")
+            dependencies = results["dependencies"]
+            dependencies.extend(f"{name}@{version}" for name, version in deps.items())
+            dependencies.extend(
+                f"{name}@{version} (dev)" for name, version in dev_deps.items()
+            )
 
         except json.JSONDecodeError:
             results["dependencies"].append("Invalid JSON format")
@@ -1,6 +1,39 @@
 import base64
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
-from config import GITHUB_TOKEN
+from requests.adapters import HTTPAdapter
+from config import (
+    GITHUB_TOKEN,
+    GITHUB_CACHE_DIR,
+    GITHUB_CACHE_MAX_BYTES,
+    GITHUB_CACHE_MAX_AGE,
+)
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on concurrent GitHub requests, kept low for the secondary rate limit
+MAX_CONCURRENT_REQUESTS = 8
+
+# The cache directory is pruned after this many writes
+CACHE_PRUNE_INTERVAL = 100
+_cache_writes = 0
+
+# Shared session so GitHub requests reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=MAX_CONCURRENT_REQUESTS,
+    ),
+)
 
 
 def get_github_headers():
@@ -11,15 +44,120 @@ def get_github_headers():
     return headers
 
 
+def get_cached_json(url, immutable=False):
+    """
+    GET a GitHub API URL through the disk cache.
+
+    A cached response is revalidated with If-None-Match and reused on a 304
+    (which does not count against the rate limit). Responses for immutable
+    URLs, e.g. a tree addressed by commit SHA, are reused without a request.
+
+    Returns a (status_code, json_body) tuple; json_body is None unless 200.
+    """
+    cache_path = os.path.join(
+        GITHUB_CACHE_DIR, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json"
+    )
+    headers = get_github_headers()
+
+    cached = None
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    if cached is not None:
+        if immutable:
+            return 200, cached["body"]
+        headers["If-None-Match"] = cached["etag"]
+
+    response = _SESSION.get(url, headers=headers)
+    if response.status_code == 304 and cached is not None:
+        return 200, cached["body"]
+    if response.status_code != 200:
+        return response.status_code, None
+
+    body = response.json()
+    etag = response.headers.get("ETag")
+    if etag or immutable:
+        _write_cache_entry(cache_path, {"etag": etag, "body": body})
+
+    return 200, body
+
+
+def _write_cache_entry(cache_path, entry):
+    """Atomically write a cache entry, pruning the cache directory now and then."""
+    global _cache_writes
+    tmp_path = None
+    try:
+        os.makedirs(GITHUB_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=GITHUB_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.error("Error writing GitHub cache: %s", e)
+        if tmp_path:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+        return
+
+    _cache_writes += 1
+    if _cache_writes % CACHE_PRUNE_INTERVAL == 0:
+        _prune_cache()
+
+
+def _prune_cache():
+    """Drop expired cache entries, then the oldest ones until the cache fits GITHUB_CACHE_MAX_BYTES."""
+    now = time.time()
+    entries = []
+    total = 0
+    try:
+        with os.scandir(GITHUB_CACHE_DIR) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                if now - stat.st_mtime > GITHUB_CACHE_MAX_AGE:
+                    _remove_quietly(entry.path)
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+    except OSError as e:
+        logger.error("Error pruning GitHub cache: %s", e)
+        return
+
+    if total <= GITHUB_CACHE_MAX_BYTES:
+        return
+    entries.sort()
+    for _, size, path in entries:
+        _remove_quietly(path)
+        total -= size
+        if total <= GITHUB_CACHE_MAX_BYTES:
+            break
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
 def get_repository_info(owner, repo):
     """Get basic information about a repository."""
     url = f"https://api.github.com/repos/{owner}/{repo}"
-    response = requests.get(url, headers=get_github_headers())
+    status_code, repo_info = get_cached_json(url)
 
-    if response.status_code == 200:
-        return response.json()
+    if status_code == 200:
+        return repo_info
     else:
-        print(f"Error getting repository info: {response.status_code}")
+        logger.error("Error getting repository info: %s", status_code)
         return {}
 
 
@@ -27,47 +165,84 @@ def get_repository_tree(owner, repo, branch="main"):
     """Get the file tree of a repository."""
     # First, get the branch information to get the latest commit SHA
     branch_url = f"https://api.github.com/repos/{owner}/{repo}/branches/{branch}"
-    branch_response = requests.get(branch_url, headers=get_github_headers())
+    status_code, branch_data = get_cached_json(branch_url)
 
-    if branch_response.status_code != 200:
-        print(f"Error getting branch info: {branch_response.status_code}")
+    if status_code != 200:
+        logger.error("Error getting branch info: %s", status_code)
         return {}
 
-    branch_data = branch_response.json()
     commit_sha = branch_data.get("commit", {}).get("sha")
 
     if not commit_sha:
-        print("Could not find commit SHA")
+        logger.error("Could not find commit SHA")
         return {}
 
-    # Now, get the tree using the commit SHA
+    # Now, get the tree using the commit SHA (immutable, so served from cache once stored)
     tree_url = f"https://api.github.com/repos/{owner}/{repo}/git/trees/{commit_sha}?recursive=1"
-    tree_response = requests.get(tree_url, headers=get_github_headers())
+    status_code, tree = get_cached_json(tree_url, immutable=True)
 
-    if tree_response.status_code == 200:
-        return tree_response.json()
+    if status_code == 200:
+        return tree
     else:
-        print(f"Error getting repository tree: {tree_response.status_code}")
+        logger.error("Error getting repository tree: %s", status_code)
         return {}
 
 
+def _decode_content(content_data):
+    """Decode the base64 content of a contents or blob API response."""
+    # GitHub API returns base64 encoded content
+    if content_data.get("encoding") == "base64" and content_data.get("content"):
+        try:
+            return base64.b64decode(content_data["content"]).decode("utf-8")
+        except Exception as e:
+            logger.error("Error decoding content: %s", e)
+    return None
+
+
 def get_file_content(owner, repo, path, branch="main"):
     """Get the content of a specific file."""
     url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}?ref={branch}"
-    response = requests.get(url, headers=get_github_headers())
+    status_code, content_data = get_cached_json(url)
 
-    if response.status_code == 200:
-        content_data = response.json()
-        # GitHub API returns base64 encoded content
-        if content_data.get("encoding") == "base64" and content_data.get("content"):
-            try:
-                decoded_content = base64.b64decode(content_data["content"]).decode(
-                    "utf-8"
-                )
-                return decoded_content
-            except Exception as e:
-                print(f"Error decoding content: {str(e)}")
+    if status_code == 200:
+        return _decode_content(content_data)
+    else:
+        logger.error("Error getting file content: %s", status_code)
         return None
+
+
+def get_blob_content(owner, repo, sha):
+    """Get the content of a file by its blob SHA (immutable, so served from cache once stored)."""
+    url = f"https://api.github.com/repos/{owner}/{repo}/git/blobs/{sha}"
+    status_code, blob_data = get_cached_json(url, immutable=True)
+
+    if status_code == 200:
+        return _decode_content(blob_data)
     else:
-        print(f"Error getting file content: {response.status_code}")
+        logger.error("Error getting blob content: %s", status_code)
         return None
+
+
+def get_files_content(owner, repo, paths, branch="main", shas=None):
+    """
+    Get the contents of several files concurrently, in the order of paths.
+
+    If shas (the tree items' blob SHAs, parallel to paths) is given, files are
+    fetched by SHA and cached without revalidation.
+    """
+
+    def fetch(path, sha):
+        try:
+            if sha:
+                return get_blob_content(owner, repo, sha)
+            return get_file_content(owner, repo, path, branch)
+        except Exception as e:
+            logger.error("Error getting file content for %s: %s", path, e)
+            return None
+
+    if not paths:
+        return []
+
+    workers = min(MAX_CONCURRENT_REQUESTS, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(fetch, paths, shas or [None] * len(paths)))
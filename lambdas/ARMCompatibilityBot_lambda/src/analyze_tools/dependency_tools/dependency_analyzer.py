@@ -1,12 +1,12 @@
+import copy
 import re
 import subprocess
 import tempfile
 import logging
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple, Union
 import os
-import sys
-
-sys.path.append(os.path.dirname("/Users/woohyeok/development/2025/alpha/"))
 
 # Import the package compatibility checker
 from analyze_tools.dependency_tools.package_compatibility import (
@@ -22,6 +22,12 @@ from analyze_tools.dependency_tools.js_compatibility import analyze_package_json
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for requirement lines and pipgrip --tree output
+_REQ_LINE_RE = re.compile(r"^([A-Za-z0-9_.-]+)([<>=!~].+)?$")
+_VERSION_STRIP_RE = re.compile(r"[=<>!~].*$")
+_TREE_PACKAGE_RE = re.compile(r"^(\w[\w.-]+).*$")
+_TREE_DEPENDENCY_RE = re.compile(r"^\s+[└├]── (\w[\w.-]+).*$")
+
 # Cache for dependency trees to avoid repeated pipgrip calls
 DEPENDENCY_TREE_CACHE = {}
 
@@ -93,12 +99,10 @@ def parse_pipgrip_tree(tree_output: str) -> Dict[str, List[str]]:
     """
     dependency_tree = {}
     current_package = None
-    package_pattern = re.compile(r"^(\w[\w.-]+).*$")
-    dependency_pattern = re.compile(r"^\s+[└├]── (\w[\w.-]+).*$")
 
     for line in tree_output.splitlines():
         # Match a top-level package
-        package_match = package_pattern.match(line)
+        package_match = _TREE_PACKAGE_RE.match(line)
         if package_match and not line.startswith(" "):
             current_package = clean_package_name(package_match.group(1))
             dependency_tree[current_package] = []
@@ -106,7 +110,7 @@ def parse_pipgrip_tree(tree_output: str) -> Dict[str, List[str]]:
 
         # Match a dependency
         if current_package:
-            dependency_match = dependency_pattern.match(line)
+            dependency_match = _TREE_DEPENDENCY_RE.match(line)
             if dependency_match:
                 dependency = clean_package_name(dependency_match.group(1))
                 dependency_tree[current_package].append(dependency)
@@ -118,9 +122,34 @@ def parse_pipgrip_tree(tree_output: str) -> Dict[str, List[str]]:
     return dependency_tree
 
 
+# PyPI 조회를 병렬로 수행할 최대 스레드 수
+PYPI_PREFETCH_WORKERS = 16
+
+
+def prefetch_pypi_compatibility(package_names) -> None:
+    """
+    PyPI 호환성 조회를 스레드 풀로 미리 수행하여 캐시를 채웁니다.
+
+    이후의 순차적인 check_package_compatibility 호출은 캐시된 결과를 사용하므로
+    HTTP 왕복 시간이 패키지 수만큼 누적되지 않습니다.
+
+    Args:
+        package_names: 조회할 패키지 이름 목록 (중복은 제거됨)
+    """
+    unique_names = list(dict.fromkeys(map(clean_package_name, package_names)))
+    if len(unique_names) < 2:
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(PYPI_PREFETCH_WORKERS, len(unique_names))
+    ) as executor:
+        # 결과는 캐시에 저장되므로 소비만 함
+        list(executor.map(check_pypi_package_arm_compatibility, unique_names))
+
+
 def clean_package_name(name: str) -> str:
     """Clean package name by removing version specifiers."""
-    return re.sub(r"[=<>!~].*$", "", name.strip().lower())
+    return _VERSION_STRIP_RE.sub("", name.strip().lower())
 
 
 def analyze_requirements_with_pipgrip(content: str) -> List[Dict[str, Any]]:
@@ -138,13 +167,10 @@ def analyze_requirements_with_pipgrip(content: str) -> List[Dict[str, Any]]:
 
     # Get direct dependencies first
     direct_dependencies = []
-    for line in content.splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-
+    lines = [s for s in map(str.strip, content.splitlines()) if s and s[0] != "#"]
+    for line in lines:
         # Parse package name and version
-        match = re.match(r"^([A-Za-z0-9_.-]+)([<>=!~].+)?$", line)
+        match = _REQ_LINE_RE.match(line)
         if match:
             package_name = match.group(1)
             version_spec = match.group(2) if len(match.groups()) > 1 else None
@@ -154,6 +180,12 @@ def analyze_requirements_with_pipgrip(content: str) -> List[Dict[str, Any]]:
     try:
         dependency_tree = get_dependency_tree(content)
 
+        # 직접/전이 의존성의 PyPI 조회를 한 번에 병렬로 수행
+        prefetch_pypi_compatibility(
+            [name for name, _, _ in direct_dependencies]
+            + [name for pkg, deps in dependency_tree.items() for name in (pkg, *deps)]
+        )
+
         # Process direct dependencies first
         for package_name, version_spec, original_line in direct_dependencies:
             clean_name = clean_package_name(package_name)
@@ -192,6 +224,7 @@ def analyze_requirements_with_pipgrip(content: str) -> List[Dict[str, Any]]:
         logger.error(f"Error in dependency resolution: {str(e)}")
         # Fallback: just analyze direct dependencies if pipgrip fails
         if not results:
+            prefetch_pypi_compatibility([name for name, _, _ in direct_dependencies])
             for package_name, version_spec, original_line in direct_dependencies:
                 compatibility = check_pypi_package_arm_compatibility(package_name)
 
@@ -209,21 +242,42 @@ def analyze_requirements_with_pipgrip(content: str) -> List[Dict[str, Any]]:
     return results
 
 
-def check_package_compatibility(
-    package_name, version_spec=None, original_line=None, direct=True, parent=None
-):
+class _TransientCheckError(Exception):
+    """일시적인 오류가 포함된 판정 (예외로 전달하여 lru_cache에 저장되지 않도록 함)"""
+
+    def __init__(self, decision: Tuple[Union[bool, str], str, Dict[str, Any]]):
+        super().__init__("compatibility decision involved a transient error")
+        self.decision = decision
+
+
+@lru_cache(maxsize=4096)
+def _compat_decision(
+    package_name: str, version_spec: Optional[str]
+) -> Tuple[Union[bool, str], str, Dict[str, Any]]:
     """
-    패키지의 ARM 호환성을 검사하는 함수입니다.
+    패키지/버전 스펙 조합에 대한 ARM 호환성 판정 (확정된 결과만 캐싱)
+
+    Raises:
+        _TransientCheckError: 검사 중 일시적인 오류(PyPI 장애, 네트워크 오류 등)가 있었던 경우
+    """
+    decision = _run_compat_checks(package_name, version_spec)
+    if any(check and check.get("transient") for check in decision[2].values()):
+        raise _TransientCheckError(decision)
+    return decision
+
+
+def _run_compat_checks(
+    package_name: str, version_spec: Optional[str]
+) -> Tuple[Union[bool, str], str, Dict[str, Any]]:
+    """
+    패키지/버전 스펙 조합에 대한 ARM 호환성 검사 (PyPI -> Wheel Tester -> 소스 컴파일)
 
     Args:
         package_name (str): 패키지 이름
         version_spec (str, optional): 버전 스펙
-        original_line (str, optional): 원본 의존성 라인
-        direct (bool): 직접 의존성 여부
-        parent (str, optional): 부모 패키지 이름
 
     Returns:
-        dict: 호환성 검사 결과
+        tuple: (호환성, 사유, 단계별 검사 결과)
     """
     debug_info = {
         "pypi_check": None,
@@ -235,46 +289,19 @@ def check_package_compatibility(
     compatibility = check_pypi_package_arm_compatibility(package_name)
     debug_info["pypi_check"] = compatibility
     if compatibility.get("compatible") == True:
-        return {
-            "dependency": original_line or package_name,
-            "name": package_name,
-            "version_spec": version_spec,
-            "compatible": compatibility.get("compatible"),
-            "reason": compatibility.get("reason"),
-            "direct": direct,
-            "parent": parent,
-            "debug_info": debug_info,
-        }
+        return compatibility.get("compatible"), compatibility.get("reason"), debug_info
 
     # 2. ARM64 Python Wheel Tester 결과 확인
     compatibility = check_arm64_wheel_tester(package_name, version_spec)
     debug_info["wheel_tester_check"] = compatibility
     if compatibility.get("compatible") == True:
-        return {
-            "dependency": original_line or package_name,
-            "name": package_name,
-            "version_spec": version_spec,
-            "compatible": compatibility.get("compatible"),
-            "reason": compatibility.get("reason"),
-            "direct": direct,
-            "parent": parent,
-            "debug_info": debug_info,
-        }
+        return compatibility.get("compatible"), compatibility.get("reason"), debug_info
 
     # 3. 소스 컴파일 시도
     compatibility = try_source_compilation(package_name, version_spec)
     debug_info["source_compilation"] = compatibility
     if compatibility.get("compatible") == True:
-        return {
-            "dependency": original_line or package_name,
-            "name": package_name,
-            "version_spec": version_spec,
-            "compatible": compatibility.get("compatible"),
-            "reason": compatibility.get("reason"),
-            "direct": direct,
-            "parent": parent,
-            "debug_info": debug_info,
-        }
+        return compatibility.get("compatible"), compatibility.get("reason"), debug_info
 
     # 모든 검사가 실패한 경우
     detailed_reason = f"""
@@ -284,12 +311,39 @@ def check_package_compatibility(
     3. 소스 컴파일: {debug_info['source_compilation'].get('reason', '정보 없음')}
     """
 
+    return compatibility.get("compatible", False), detailed_reason, debug_info
+
+
+def check_package_compatibility(
+    package_name, version_spec=None, original_line=None, direct=True, parent=None
+):
+    """
+    패키지의 ARM 호환성을 검사하는 함수입니다.
+
+    Args:
+        package_name (str): 패키지 이름
+        version_spec (str, optional): 버전 스펙
+        original_line (str, optional): 원본 의존성 라인
+        direct (bool): 직접 의존성 여부
+        parent (str, optional): 부모 패키지 이름
+
+    Returns:
+        dict: 호환성 검사 결과
+    """
+    try:
+        compatible, reason, debug_info = _compat_decision(package_name, version_spec)
+    except _TransientCheckError as e:
+        compatible, reason, debug_info = e.decision
+
+    # 캐시된 객체를 호출자가 수정하지 않도록 복사본 반환
+    debug_info = copy.deepcopy(debug_info)
+
     return {
         "dependency": original_line or package_name,
         "name": package_name,
         "version_spec": version_spec,
-        "compatible": compatibility.get("compatible", False),
-        "reason": detailed_reason,
+        "compatible": compatible,
+        "reason": reason,
         "direct": direct,
         "parent": parent,
         "debug_info": debug_info,
@@ -411,17 +465,3 @@ def analyze_dependency_compatibility(dependency_analysis):
         "recommendations": unique_recommendations,
         "reasoning": reasoning,
     }
-
-
-if __name__ == "__main__":
-
-    content = """
-    thrift
-    tensorflow-data-validation
-    """
-
-    # 의존성 분석 실행
-    dependency_analysis = analyze_requirements_with_pipgrip(content)
-
-    # 결과 출력
-    print(dependency_analysis)
@@ -27,17 +27,51 @@ import json
 import subprocess
 import sys
 import tempfile
-from bs4 import BeautifulSoup
+import threading
+import time
+from functools import lru_cache
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 # Configure logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Cache for PyPI package information to avoid repeated API calls
-PYPI_CACHE = {}
+# Shared session so repeated requests reuse pooled keep-alive connections
+# (sized for concurrent PyPI lookups from the dependency analyzer)
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+        ),
+    ),
+)
+
+WHEEL_TESTER_URL = "https://geoffreyblake.github.io/arm64-python-wheel-tester/"
+# ETag and parsed rows of the wheel tester page, persisted across warm invocations
+WHEEL_TESTER_META_PATH = os.path.join(tempfile.gettempdir(), "wt_meta.json")
+WHEEL_TESTER_TIMEOUT = 10  # seconds
+# Within this window the page is not revalidated at all (not even a conditional GET)
+WHEEL_TESTER_TTL = 600  # seconds
+# In-memory copy of the wheel tester meta plus its lookup index.
+# Replaced as a whole on refresh and never mutated, so readers need no lock
+_WHEEL_TESTER_STATE = {}
+# Held by the one thread refreshing the page; others keep reading the current state
+_WHEEL_TESTER_REFRESH_LOCK = threading.Lock()
+
+# 패키지 이름 뒤의 버전 지정자 (예: "numpy>=1.20" -> ">=1.20")
+_VERSION_STRIP_RE = re.compile(r"[=<>!~].*$")
+# 휠 파일명의 플랫폼 태그 (예: "...-manylinux_2_17_aarch64.whl" -> "manylinux_2_17_aarch64")
+_WHL_PLAT_RE = re.compile(r"-([^-]+)\.whl$")
+# ARM 휠을 나타내는 플랫폼 태그 식별자
+ARM_PLATFORM_IDS = ("aarch64", "arm64", "armv8", "armv7l")
 
 build_env = {
     "CFLAGS": "-march=armv8-a -O3",
@@ -47,152 +81,319 @@ build_env = {
 }
 
 
-def check_pypi_package_arm_compatibility(package_name, package_version=None):
+@lru_cache(maxsize=4096)
+def _fetch_pypi_info(clean_name, package_version):
     """
-    Check if a PyPI package is compatible with ARM64 architecture.
-    Uses PyPI API to check for ARM64 wheel availability or universal compatibility.
-
-    Args:
-        package_name (str): Name of the package (e.g., "pybloomfiltermmap3" or "numpy>=1.20").
-        package_version (str, optional): Specific version to check (e.g., "0.6.0").
+    PyPI JSON API를 조회하여 ARM64 호환성 판정 (정상 응답만 캐싱)
 
-    Returns:
-        dict: {"compatible": bool or "partial" or "unknown", "reason": str}
+    Raises:
+        requests.HTTPError: PyPI가 200 이외의 상태 코드를 반환한 경우
     """
-    cache_key = f"{package_name}@{package_version}" if package_version else package_name
-    if cache_key in PYPI_CACHE:
-        return PYPI_CACHE[cache_key]
-
-    try:
+    # PyPI JSON API 호출
+    url = f"https://pypi.org/pypi/{clean_name}/json"
+    if package_version:
+        url = f"https://pypi.org/pypi/{clean_name}/{package_version}/json"
 
-        # 패키지 이름 정리
-        package_name = package_name.strip().lower()
-        clean_name = re.sub(r"[=<>!~].*$", "", package_name)  # 버전 지정자 제거
+    response = _SESSION.get(url, timeout=5)
 
-        # PyPI JSON API 호출
-        url = f"https://pypi.org/pypi/{clean_name}/json"
-        if package_version:
-            url = f"https://pypi.org/pypi/{clean_name}/{package_version}/json"
+    if response.status_code != 200:
+        # 예외는 lru_cache에 저장되지 않으므로 일시적인 오류가 캐싱되지 않음
+        raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
 
-        response = requests.get(url, timeout=5)
+    data = response.json()
 
-        if response.status_code != 200:
-            logger.warning(
-                f"Failed to fetch package info for {clean_name}: HTTP {response.status_code}"
-            )
+    # 특정 버전 확인 또는 최신 버전 사용
+    if package_version:
+        if package_version not in data["releases"]:
             return {
                 "compatible": "unknown",
-                "reason": f"Package not found or PyPI API error: {response.status_code}",
+                "reason": f"Version {package_version} not found",
             }
+        releases = data["releases"][package_version]
+    else:
+        # 최신 버전 사용 (urls 필드가 현재 버전의 배포 파일 정보를 담고 있음)
+        releases = data["urls"]
+
+    # 플랫폼 호환성 확인 개선 (분류별 예시 파일 하나씩만 기록)
+    arm_wheel = None
+    universal_wheel = None
+    sdist_file = None
+
+    for release in releases:
+        filename = release.get("filename", "")
+        packagetype = release.get("packagetype", "")
+
+        # 휠 파일 확인
+        if packagetype == "bdist_wheel":
+            # 파일명에서 플랫폼 태그 추출
+            match = _WHL_PLAT_RE.search(filename)
+            platform_tag = match.group(1).lower() if match else ""
+
+            # ARM 호환 휠 확인
+            if any(arm_id in platform_tag for arm_id in ARM_PLATFORM_IDS):
+                # ARM 휠이 있으면 결과가 바뀌지 않으므로 즉시 종료
+                arm_wheel = filename
+                break
+            # 범용 휠 확인
+            elif universal_wheel is None and platform_tag == "any":
+                universal_wheel = filename
+
+        # 소스 배포판 확인
+        elif packagetype == "sdist" and sdist_file is None:
+            sdist_file = filename
+
+    # requires_python 필드 확인
+    requires_python = data["info"].get("requires_python", "")
+
+    # 플랫폼 필드 확인 (null이면 플랫폼 독립적)
+    platform = data["info"].get("platform")
+    is_platform_independent = platform is None or platform == ""
+
+    # 결과 결정
+    if arm_wheel:
+        result = {
+            "compatible": True,
+            "reason": f"ARM-specific wheel available: {arm_wheel}",
+        }
+    elif universal_wheel:
+        result = {
+            "compatible": True,
+            "reason": f"Universal wheel available: {universal_wheel}",
+        }
+    elif sdist_file and is_platform_independent:
+        result = {
+            "compatible": True,
+            "reason": f"Platform-independent source distribution available: {sdist_file}",
+        }
+    elif sdist_file:
+        # 확장 모듈이 있는지 확인하기 위한 분류자 검사
+        classifiers = data["info"].get("classifiers", [])
+        has_c_extension = any("Programming Language :: C" in c for c in classifiers)
+        has_cython = any("Programming Language :: Cython" in c for c in classifiers)
 
-        data = response.json()
-
-        # 특정 버전 확인 또는 최신 버전 사용
-        if package_version:
-            if package_version not in data["releases"]:
-                return {
-                    "compatible": "unknown",
-                    "reason": f"Version {package_version} not found",
-                }
-            releases = data["releases"][package_version]
-        else:
-            # 최신 버전 사용 (urls 필드가 현재 버전의 배포 파일 정보를 담고 있음)
-            releases = data["urls"]
-
-        # 플랫폼 호환성 확인 개선
-        arm_wheels = []
-        universal_wheels = []
-        sdist_files = []
-
-        for release in releases:
-            filename = release.get("filename", "")
-            packagetype = release.get("packagetype", "")
-
-            # 휠 파일 확인
-            if packagetype == "bdist_wheel":
-                # 파일명에서 플랫폼 태그 추출
-                platform_tag = (
-                    filename.rsplit("-", 1)[1].split(".whl")[0]
-                    if ".whl" in filename
-                    else ""
-                )
-
-                # ARM 호환 휠 확인
-                if any(
-                    arm_id in platform_tag.lower()
-                    for arm_id in ["aarch64", "arm64", "armv8", "armv7l"]
-                ):
-                    arm_wheels.append(filename)
-                # 범용 휠 확인
-                elif platform_tag == "any" or "none-any" in platform_tag:
-                    universal_wheels.append(filename)
-
-            # 소스 배포판 확인
-            elif packagetype == "sdist":
-                sdist_files.append(filename)
-
-        # requires_python 필드 확인
-        requires_python = data["info"].get("requires_python", "")
-
-        # 플랫폼 필드 확인 (null이면 플랫폼 독립적)
-        platform = data["info"].get("platform")
-        is_platform_independent = platform is None or platform == ""
-
-        # 결과 결정
-        if arm_wheels:
-            result = {
-                "compatible": True,
-                "reason": f"ARM-specific wheels available: {', '.join(arm_wheels)}",
-            }
-        elif universal_wheels:
+        if has_c_extension or has_cython:
             result = {
-                "compatible": True,
-                "reason": f"Universal wheels available: {', '.join(universal_wheels)}",
-            }
-        elif sdist_files and is_platform_independent:
-            result = {
-                "compatible": True,
-                "reason": f"Platform-independent source distribution available: {', '.join(sdist_files)}",
+                "compatible": "partial",
+                "reason": "Source distribution with C/Cython extensions may require compilation",
             }
-        elif sdist_files:
-            # 확장 모듈이 있는지 확인하기 위한 분류자 검사
-            classifiers = data["info"].get("classifiers", [])
-            has_c_extension = any("Programming Language :: C" in c for c in classifiers)
-            has_cython = any("Programming Language :: Cython" in c for c in classifiers)
-
-            if has_c_extension or has_cython:
-                result = {
-                    "compatible": "partial",
-                    "reason": "Source distribution with C/Cython extensions may require compilation",
-                }
-            else:
-                result = {
-                    "compatible": True,
-                    "reason": "Pure Python source distribution, likely compatible",
-                }
         else:
             result = {
-                "compatible": False,
-                "reason": "No compatible wheels or source distribution available",
+                "compatible": True,
+                "reason": "Pure Python source distribution, likely compatible",
             }
+    else:
+        result = {
+            "compatible": False,
+            "reason": "No compatible wheels or source distribution available",
+        }
+
+    # 패키지가 yanked(철회)되었는지 확인
+    if data["info"].get("yanked", False):
+        yanked_reason = data["info"].get("yanked_reason", "No reason provided")
+        result["warning"] = f"Package version has been yanked: {yanked_reason}"
+
+    return result
+
+
+def check_pypi_package_arm_compatibility(package_name, package_version=None):
+    """
+    Check if a PyPI package is compatible with ARM64 architecture.
+    Uses PyPI API to check for ARM64 wheel availability or universal compatibility.
 
-        # 패키지가 yanked(철회)되었는지 확인
-        if data["info"].get("yanked", False):
-            yanked_reason = data["info"].get("yanked_reason", "No reason provided")
-            result["warning"] = f"Package version has been yanked: {yanked_reason}"
+    Args:
+        package_name (str): Name of the package (e.g., "pybloomfiltermmap3" or "numpy>=1.20").
+        package_version (str, optional): Specific version to check (e.g., "0.6.0").
+
+    Returns:
+        dict: {"compatible": bool or "partial" or "unknown", "reason": str}
+    """
+    try:
+
+        # 패키지 이름 정리
+        clean_name = _VERSION_STRIP_RE.sub(
+            "", package_name.strip().lower()
+        )  # 버전 지정자 제거
 
-        # 캐싱
-        PYPI_CACHE[cache_key] = result
-        return result
+        return _fetch_pypi_info(clean_name, package_version)
 
+    except requests.HTTPError as e:
+        status_code = e.response.status_code
+        logger.warning(
+            f"Failed to fetch package info for {clean_name}: HTTP {status_code}"
+        )
+        return {
+            "compatible": "unknown",
+            "reason": f"Package not found or PyPI API error: {status_code}",
+            # 404 외의 응답(5xx, 429 등)은 일시적인 오류일 수 있음
+            "transient": status_code != 404,
+        }
     except Exception as e:
         logger.error(f"Error checking {package_name}: {str(e)}")
         return {
             "compatible": "unknown",
             "reason": f"Error checking compatibility: {str(e)}",
+            "transient": True,
         }
 
 
+def load_wheel_tester_meta() -> Dict[str, Any]:
+    """디스크에 저장된 Wheel Tester ETag 및 결과 행 로드"""
+    try:
+        with open(WHEEL_TESTER_META_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_wheel_tester_meta(
+    etag: Optional[str], rows: List[List[str]], fetched_at: float
+) -> None:
+    """Wheel Tester ETag, 결과 행 및 확인 시각을 디스크에 저장"""
+    try:
+        with open(WHEEL_TESTER_META_PATH, "w", encoding="utf-8") as f:
+            json.dump({"etag": etag, "rows": rows, "fetched_at": fetched_at}, f)
+    except OSError as e:
+        logger.warning(f"Wheel Tester 캐시 저장 실패: {str(e)}")
+
+
+def _build_wheel_tester_index(
+    rows: List[List[str]],
+) -> Dict[Tuple[str, Optional[str]], bool]:
+    """
+    Wheel Tester 결과 행을 (패키지, 버전) -> 통과 여부 인덱스로 변환
+
+    (패키지, None) 키는 버전과 무관하게 처음 나타나는 pass/fail 결과를 가리킵니다.
+    """
+    index = {}
+    for row_package, row_version, result_cell in rows:
+        if "pass" in result_cell:
+            passed = True
+        elif "fail" in result_cell:
+            passed = False
+        else:
+            continue
+
+        # 테이블 순서상 첫 번째 pass/fail 행을 유지
+        index.setdefault((row_package, None), passed)
+        index.setdefault((row_package, row_version), passed)
+    return index
+
+
+def _make_wheel_tester_state(
+    etag: Optional[str],
+    rows: List[List[str]],
+    fetched_at: float,
+    index: Optional[Dict[Tuple[str, Optional[str]], bool]] = None,
+) -> Dict[str, Any]:
+    """행, 인덱스, 마지막 확인 시각을 담은 (이후 변경되지 않는) 상태 딕셔너리 생성"""
+    if index is None:
+        index = _build_wheel_tester_index(rows)
+    return {"etag": etag, "rows": rows, "index": index, "fetched_at": fetched_at}
+
+
+def _fetch_wheel_tester_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Wheel Tester 페이지를 다시 확인하여 새 상태를 반환
+
+    이전 응답의 ETag를 If-None-Match로 보내고, 304 응답이면 HTML 다운로드와
+    파싱 없이 기존 상태를 그대로 사용합니다.
+    """
+    headers = {}
+    if state.get("etag") and "rows" in state:
+        headers["If-None-Match"] = state["etag"]
+
+    response = _SESSION.get(
+        WHEEL_TESTER_URL, headers=headers, timeout=WHEEL_TESTER_TIMEOUT
+    )
+    fetched_at = time.time()
+    if response.status_code == 304:
+        logger.info("ARM64 Wheel Tester 결과 변경 없음, 캐시 사용")
+        # 확인 시각만 갱신 (행과 인덱스는 재사용)
+        save_wheel_tester_meta(state["etag"], state["rows"], fetched_at)
+        return _make_wheel_tester_state(
+            state["etag"], state["rows"], fetched_at, state["index"]
+        )
+    response.raise_for_status()
+
+    # BeautifulSoup으로 HTML 파싱 (bs4는 페이지가 변경된 경우에만 필요하므로 지연 import)
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(response.text, "html.parser")
+
+    rows = []
+    for row in soup.select("table tr"):
+        cells = row.select("td")
+        if not cells or len(cells) < 2:
+            continue
+
+        rows.append(
+            [
+                # 패키지 이름 정규화 (대소문자, '-', '_' 차이 처리)
+                cells[0].text.strip().lower().replace("-", "_"),
+                cells[1].text.strip(),
+                cells[-1].text.strip().lower() if len(cells) > 2 else "",
+            ]
+        )
+
+    etag = response.headers.get("ETag")
+    save_wheel_tester_meta(etag, rows, fetched_at)
+    return _make_wheel_tester_state(etag, rows, fetched_at)
+
+
+def _get_wheel_tester_state() -> Dict[str, Any]:
+    """
+    현재 Wheel Tester 상태 반환 (한 스레드만 페이지를 다시 확인)
+
+    마지막 확인 후 WHEEL_TESTER_TTL 이내이면 네트워크 요청 없이 반환합니다.
+    다른 스레드가 갱신 중이면 기다리지 않고 기존 상태를 사용하며,
+    아직 결과가 전혀 없는 경우에만 갱신이 끝나기를 기다립니다.
+    """
+    global _WHEEL_TESTER_STATE
+    state = _WHEEL_TESTER_STATE
+    if not state:
+        meta = load_wheel_tester_meta()
+        if "rows" in meta:
+            state = _WHEEL_TESTER_STATE = _make_wheel_tester_state(
+                meta.get("etag"), meta["rows"], meta.get("fetched_at", 0)
+            )
+
+    has_rows = "rows" in state
+    if has_rows and time.time() - state["fetched_at"] < WHEEL_TESTER_TTL:
+        return state
+    if not _WHEEL_TESTER_REFRESH_LOCK.acquire(blocking=not has_rows):
+        return state
+    try:
+        if _WHEEL_TESTER_STATE is not state and "rows" in _WHEEL_TESTER_STATE:
+            # 기다리는 동안 다른 스레드가 갱신을 마침
+            return _WHEEL_TESTER_STATE
+        state = _WHEEL_TESTER_STATE = _fetch_wheel_tester_state(state)
+        return state
+    finally:
+        _WHEEL_TESTER_REFRESH_LOCK.release()
+
+
+def get_wheel_tester_rows() -> List[List[str]]:
+    """
+    ARM64 Python Wheel Tester 결과 테이블을 [패키지, 버전, 결과] 행 목록으로 반환
+
+    Returns:
+        정규화된 패키지 이름, 버전, 소문자 결과 문자열로 이루어진 행 목록
+    """
+    return _get_wheel_tester_state()["rows"]
+
+
+def get_wheel_tester_index() -> Dict[Tuple[str, Optional[str]], bool]:
+    """
+    Wheel Tester 결과 행을 (패키지, 버전) -> 통과 여부 인덱스로 반환 (페이지가 바뀔 때만 재구성)
+
+    (패키지, None) 키는 버전과 무관하게 처음 나타나는 pass/fail 결과를 가리킵니다.
+
+    Returns:
+        정규화된 패키지 이름과 버전을 키로 하는 테스트 통과 여부 딕셔너리
+    """
+    return _get_wheel_tester_state()["index"]
+
+
 def check_arm64_wheel_tester(
     package_name: str, version: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -210,73 +411,24 @@ def check_arm64_wheel_tester(
 
     try:
         # ARM64 Python Wheel Tester 웹사이트에서 데이터 가져오기
-        url = "https://geoffreyblake.github.io/arm64-python-wheel-tester/"
-        response = requests.get(url)
-        response.raise_for_status()
-
-        # BeautifulSoup으로 HTML 파싱
-        soup = BeautifulSoup(response.text, "html.parser")
+        index = get_wheel_tester_index()
 
         # 패키지 이름 정규화 (대소문자, '-', '_' 차이 처리)
         normalized_name = package_name.lower().replace("-", "_")
 
-        # 테스트 결과 테이블 찾기
-        package_found = False
-        test_result = "unknown"
-
-        # 테이블 행 순회
-        for row in soup.select("table tr"):
-            cells = row.select("td")
-            if not cells or len(cells) < 2:
-                continue
-
-            # 첫 번째 셀에서 패키지 이름 추출
-            row_package = cells[0].text.strip().lower().replace("-", "_")
-
-            # 패키지 이름 일치 확인
-            if row_package == normalized_name:
-                package_found = True
-
-                # 버전 확인 (버전이 지정된 경우)
-                if version:
-                    row_version = cells[1].text.strip() if len(cells) > 1 else ""
-                    if row_version != version:
-                        continue
-
-                # 결과 셀에서 테스트 결과 추출
-                result_cell = cells[-1].text.strip().lower() if len(cells) > 2 else ""
-
-                if "pass" in result_cell:
-                    test_result = "pass"
-                    break
-                elif "fail" in result_cell:
-                    test_result = "fail"
-                    break
-
-        if package_found:
-            if test_result == "pass":
-                return {
-                    "name": package_name,
-                    "version_spec": version,
-                    "compatible": True,
-                    "reason": "ARM64 Python Wheel Tester에서 테스트 통과",
-                    "source": "arm64_wheel_tester",
-                }
-            elif test_result == "fail":
-                return {
-                    "name": package_name,
-                    "version_spec": version,
-                    "compatible": False,
-                    "reason": "ARM64 Python Wheel Tester에서 테스트 실패",
-                    "source": "arm64_wheel_tester",
-                }
+        compatible = index.get((normalized_name, version or None), "unknown")
+        if compatible is True:
+            reason = "ARM64 Python Wheel Tester에서 테스트 통과"
+        elif compatible is False:
+            reason = "ARM64 Python Wheel Tester에서 테스트 실패"
+        else:
+            reason = "ARM64 Python Wheel Tester에서 패키지 정보 없음"
 
-        # 패키지를 찾지 못한 경우
         return {
             "name": package_name,
             "version_spec": version,
-            "compatible": "unknown",
-            "reason": "ARM64 Python Wheel Tester에서 패키지 정보 없음",
+            "compatible": compatible,
+            "reason": reason,
             "source": "arm64_wheel_tester",
         }
 
@@ -288,6 +440,7 @@ def check_arm64_wheel_tester(
             "compatible": "unknown",
             "reason": f"ARM64 Wheel Tester 확인 중 오류: {str(e)}",
             "source": "arm64_wheel_tester",
+            "transient": True,
         }
 
 
@@ -377,6 +530,7 @@ def try_source_compilation(
             "reason": f"소스 컴파일 중 오류 발생: {str(e)}",
             "build_output": None,
             "build_error": str(e),
+            "transient": True,
         }
 
 
@@ -440,14 +594,3 @@ def parse_package_json(content):
         )
 
     return results
-
-
-# 예시 사용
-if __name__ == "__main__":
-    # pybloomfiltermmap3 최신 버전 확인
-    result = check_pypi_package_arm_compatibility("rbloom")
-    print(result)
-
-    # 특정 버전 확인
-    result = check_pypi_package_arm_compatibility("pybloomfiltermmap3", "0.6.0")
-    print(result)
@@ -1,46 +1,73 @@
+import re
+from functools import lru_cache
+
+# Common images that offer ARM support
+COMMON_ARM_IMAGES = frozenset(
+    [
+        "alpine",
+        "ubuntu",
+        "python",
+        "node",
+        "golang",
+        "amazon/aws-cli",
+        "debian",
+        "centos",
+        "fedora",
+        "amazonlinux",
+        "nginx",
+        "redis",
+        "postgres",
+        "mysql",
+        "mongo",
+    ]
+)
+
+# One case-insensitive match classifies an image reference, dispatched on the group name:
+#   arm    - explicit ARM marker anywhere (takes priority over x86 markers)
+#   x86    - explicit x86 marker anywhere
+#   common - repository (or its last path segment) is a common ARM image,
+#            with an optional registry/namespace prefix and tag or digest
+_DOCKER_IMAGE_RE = re.compile(
+    r"(?=.*?(?P<arm>arm64|arm/v))"
+    r"|(?=.*?(?P<x86>amd64|x86_64))"
+    r"|(?P<common>(?:[^@]*/)?(?:"
+    + "|".join(map(re.escape, sorted(COMMON_ARM_IMAGES)))
+    + r")(?:[:@][^/]*)?\Z)",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=256)
 def is_docker_image_arm_compatible(base_image):
-    """Check if a Docker image is ARM compatible."""
+    """
+    Check if a Docker image is ARM compatible.
+    Results are cached and shared between callers, so copy before mutating.
+    """
+
+    match = _DOCKER_IMAGE_RE.match(base_image)
+    kind = match.lastgroup if match else None
 
     # Check if image explicitly specifies architecture
-    if "arm64" in base_image or "arm/v" in base_image:
+    if kind == "arm":
         return {"image": base_image, "compatible": True, "already_arm": True}
-    elif "amd64" in base_image or "x86_64" in base_image:
+    elif kind == "x86":
         return {
             "image": base_image,
             "compatible": False,
             "reason": "Explicitly uses x86 architecture",
         }
+    elif kind == "common":
+        return {
+            "image": base_image,
+            "compatible": True,
+            "suggestion": f"Add platform specification: --platform=linux/arm64 for {base_image}",
+        }
     else:
-        # Common images that offer ARM support
-        common_arm_images = [
-            "alpine",
-            "ubuntu",
-            "python",
-            "node",
-            "golang",
-            "amazon/aws-cli",
-            "debian",
-            "centos",
-            "fedora",
-            "amazonlinux",
-            "nginx",
-            "redis",
-            "postgres",
-            "mysql",
-            "mongo",
-        ]
-        if any(img in base_image.lower() for img in common_arm_images):
-            return {
-                "image": base_image,
-                "compatible": True,
-                "suggestion": f"Add platform specification: --platform=linux/arm64 for {base_image}",
-            }
-        else:
-            return {
-                "image": base_image,
-                "compatible": "unknown",
-                "reason": "Manual verification needed",
-            }
+        return {
+            "image": base_image,
+            "compatible": "unknown",
+            "reason": "Manual verification needed",
+        }
 
 
 def analyze_docker_compatibility(dockerfile_analysis):
@@ -54,21 +81,24 @@ def analyze_docker_compatibility(dockerfile_analysis):
     for docker_analysis in dockerfile_analysis:
         file_path = docker_analysis.get("file", "unknown")
         for base_image in docker_analysis.get("analysis", {}).get("base_images", []):
-            compatibility = is_docker_image_arm_compatible(base_image)
+            compatibility = dict(is_docker_image_arm_compatible(base_image))
             compatibility["file"] = file_path
             docker_results.append(compatibility)
 
+            already_arm = compatibility.get("already_arm", False)
+            compatible = compatibility.get("compatible")
+
             # Add reasoning for this docker image
-            if compatibility.get("already_arm", False):
+            if already_arm:
                 reason = f"Docker image {base_image} explicitly uses ARM64 architecture and is fully compatible."
                 reasoning.append(reason)
-            elif compatibility.get("compatible") is False:
+            elif compatible is False:
                 reason = f"Docker image {base_image} explicitly uses x86 architecture and is incompatible with ARM64."
                 recommendations.append(
                     f"Change base image {base_image} to an ARM64 compatible version in {file_path}"
                 )
                 reasoning.append(reason)
-            elif compatibility.get("compatible") is True:
+            elif compatible is True:
                 reason = f"Docker image {base_image} is from a common repository that supports ARM64, but platform specification is recommended."
                 recommendations.append(compatibility["suggestion"])
                 reasoning.append(reason)
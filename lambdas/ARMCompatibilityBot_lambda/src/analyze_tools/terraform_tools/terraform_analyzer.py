@@ -1,62 +1,98 @@
+# Instance family prefix -> (classification, ARM equivalent family)
+#   "arm": already ARM-based, "x86_only": no ARM equivalent,
+#   "migrate": x86 family with a suggested ARM equivalent
+INSTANCE_FAMILY_TABLE = {
+    # ARM-based instance families
+    "a1": ("arm", None),
+    "t4g": ("arm", None),
+    "m6g": ("arm", None),
+    "m7g": ("arm", None),
+    "c6g": ("arm", None),
+    "c7g": ("arm", None),
+    "r6g": ("arm", None),
+    "r7g": ("arm", None),
+    "x2gd": ("arm", None),
+    "im4gn": ("arm", None),
+    # X86-only instance families
+    "mac": ("x86_only", None),
+    "f1": ("x86_only", None),
+    "p2": ("x86_only", None),
+    "p3": ("x86_only", None),
+    "g3": ("x86_only", None),
+    "g4": ("x86_only", None),
+    "inf": ("x86_only", None),
+    # Standard instance families with ARM equivalents
+    "t3": ("migrate", "t4g"),
+    "t2": ("migrate", "t4g"),
+    "m5": ("migrate", "m6g"),
+    "m4": ("migrate", "m6g"),
+    "c5": ("migrate", "c6g"),
+    "c4": ("migrate", "c6g"),
+    "r5": ("migrate", "r6g"),
+    "r4": ("migrate", "r6g"),
+}
+
+_MAX_FAMILY_PREFIX_LEN = max(map(len, INSTANCE_FAMILY_TABLE))
+
+# Exact-family sets for the common case where the family has no extra suffix
+ARM_FAMILIES = frozenset(
+    family
+    for family, (classification, _) in INSTANCE_FAMILY_TABLE.items()
+    if classification == "arm"
+)
+X86_ONLY_FAMILIES = frozenset(
+    family
+    for family, (classification, _) in INSTANCE_FAMILY_TABLE.items()
+    if classification == "x86_only"
+)
+
+
 def is_instance_type_arm_compatible(instance_type):
     """Check if an AWS instance type is ARM compatible or can be migrated to ARM."""
 
-    # ARM-based instance families
-    arm_families = [
-        "a1",
-        "t4g",
-        "m6g",
-        "m7g",
-        "c6g",
-        "c7g",
-        "r6g",
-        "r7g",
-        "x2gd",
-        "im4gn",
-    ]
-
-    # X86-only instance families
-    x86_only_families = ["mac", "f1", "p2", "p3", "g3", "g4", "inf"]
+    family = instance_type.partition(".")[0]
 
     # Check if it's already an ARM instance
-    if any(instance_type.startswith(family) for family in arm_families):
+    if family in ARM_FAMILIES:
         return {"compatible": True, "already_arm": True}
 
     # Check if it's in a family that has no ARM equivalent
-    if any(instance_type.startswith(family) for family in x86_only_families):
+    if family in X86_ONLY_FAMILIES:
+        return {"compatible": False, "reason": "No ARM equivalent available"}
+
+    # Find the longest known family prefix (e.g. "m6g" for "m6gd.large", "m5" for "m5a.large")
+    for prefix_len in range(min(len(family), _MAX_FAMILY_PREFIX_LEN), 0, -1):
+        entry = INSTANCE_FAMILY_TABLE.get(family[:prefix_len])
+        if entry:
+            break
+    else:
+        # Default to potentially compatible but requiring further analysis
+        return {
+            "compatible": "unknown",
+            "current": instance_type,
+            "reason": "Requires manual verification",
+        }
+
+    classification, arm_family = entry
+
+    # Family variants with an extra suffix (e.g. "m6gd", "g4dn")
+    if classification == "arm":
+        return {"compatible": True, "already_arm": True}
+
+    if classification == "x86_only":
         return {"compatible": False, "reason": "No ARM equivalent available"}
 
     # For standard instance types, suggest ARM equivalents
-    instance_mapping = {
-        "t3": "t4g",
-        "t2": "t4g",
-        "m5": "m6g",
-        "m4": "m6g",
-        "c5": "c6g",
-        "c4": "c6g",
-        "r5": "r6g",
-        "r4": "r6g",
-    }
+    # Get the size part of the instance type (e.g., "large" from "t3.large")
+    size = instance_type[prefix_len:]
+    if size.startswith("."):
+        size = size[1:]  # Remove the leading dot
 
-    for x86_family, arm_family in instance_mapping.items():
-        if instance_type.startswith(x86_family):
-            # Get the size part of the instance type (e.g., "large" from "t3.large")
-            size = instance_type[len(x86_family) :]
-            if size.startswith("."):
-                size = size[1:]  # Remove the leading dot
-
-            return {
-                "compatible": True,
-                "already_arm": False,
-                "suggestion": f"{arm_family}.{size}",
-                "current": instance_type,
-            }
-
-    # Default to potentially compatible but requiring further analysis
     return {
-        "compatible": "unknown",
+        "compatible": True,
+        "already_arm": False,
+        "suggestion": f"{arm_family}.{size}",
         "current": instance_type,
-        "reason": "Requires manual verification",
     }
 
 
@@ -1,12 +1,23 @@
 import os
-from dotenv import load_dotenv
+import tempfile
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file (skipped on Lambda, which has none)
+if not os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 # GitHub API token for higher rate limits (optional but recommended)
 GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN", "")
 
+# Disk cache for GitHub API responses, revalidated with ETags
+GITHUB_CACHE_DIR = os.environ.get(
+    "GITHUB_CACHE_DIR", os.path.join(tempfile.gettempdir(), "github_cache")
+)
+# Oldest cache entries are evicted beyond this size; entries past the max age are dropped
+GITHUB_CACHE_MAX_BYTES = int(os.environ.get("GITHUB_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+GITHUB_CACHE_MAX_AGE = int(os.environ.get("GITHUB_CACHE_MAX_AGE", 7 * 24 * 3600))  # seconds
+
 # Google API key for Gemini model
 GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY", "")
 
@@ -20,6 +31,9 @@ BEDROCK_MODEL_ID = os.environ.get("BEDROCK_MODEL_ID", "us.anthropic.claude-3-7-s
 
 LLM_LANGUAGE = "english" # "korean"
 
+# Name of the Lambda that runs the analysis asynchronously (empty = run inline in the SQS handler)
+ANALYSIS_FUNCTION_NAME = os.environ.get("ANALYSIS_FN", "")
+
 # 분석 모듈 활성화 설정 추가
 ENABLED_ANALYZERS = {
     "terraform": False,
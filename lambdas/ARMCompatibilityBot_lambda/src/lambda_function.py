@@ -1,12 +1,18 @@
 # lambda_function.py
 import os
-import json
+import ssl
 import logging
-import boto3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 from slack_sdk import WebClient
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
-from sqs_processor import parse_sqs_message
-from slack_bot.slack_handler import handle_slack_interaction
+from sqs_processor import DUPLICATE_EVENT, parse_sqs_message, forget_slack_event
+from slack_bot.slack_handler import (
+    HandlerCriticalError,
+    handle_slack_interaction,
+    run_arm_analysis,
+)
 
 # Configure logging
 logger = logging.getLogger()
@@ -14,21 +20,151 @@ logger.setLevel(logging.INFO)
 
 # --- Configuration ---
 SLACK_BOT_OAUTH_TOKEN = os.getenv("SLACK_BOT_OAUTH_TOKEN")
-SQS_QUEUE_URL = os.getenv("SQS_QUEUE_URL")
-
-# --- Initialize Clients ---
-sqs = boto3.client("sqs")
-slack_client = None
-if SLACK_BOT_OAUTH_TOKEN:
-    slack_client = WebClient(token=SLACK_BOT_OAUTH_TOKEN)
-    logger.info("Slack client initialized successfully.")
-else:
+SLACK_API_TIMEOUT = 5  # seconds
+# An SQS batch holds at most 10 records
+RECORD_WORKERS = 10
+
+# Reused across warm invocations
+_EXECUTOR = ThreadPoolExecutor(max_workers=RECORD_WORKERS)
+
+# --- Clients (created lazily on first use) ---
+_slack_client = None
+if not SLACK_BOT_OAUTH_TOKEN:
     logger.error(
         "SLACK_BOT_OAUTH_TOKEN environment variable not set! Slack functionality will fail."
     )
 
-if not SQS_QUEUE_URL:
-    logger.error("SQS_QUEUE_URL environment variable not set!")
+
+def _get_slack_client() -> Optional[WebClient]:
+    """
+    Returns the Slack WebClient, creating it on the first record that needs it
+    and reusing it across warm invocations. Returns None if no token is configured.
+    """
+    global _slack_client
+    if _slack_client is None and SLACK_BOT_OAUTH_TOKEN:
+        # A shared SSL context avoids reloading CA certificates for every Slack API call
+        _slack_client = WebClient(
+            token=SLACK_BOT_OAUTH_TOKEN,
+            timeout=SLACK_API_TIMEOUT,
+            ssl=ssl.create_default_context(),
+        )
+        _slack_client.retry_handlers.append(
+            RateLimitErrorRetryHandler(max_retry_count=2)
+        )
+        logger.info("Slack client initialized successfully.")
+    return _slack_client
+
+
+# --- Record Processing ---
+
+
+def _process_record(record) -> Tuple[Optional[str], bool, Optional[bool]]:
+    """
+    Processes a single SQS record.
+
+    Returns:
+        A tuple of (messageId, processed, outcome) where processed tells whether
+        the message is done (False = report it for retry) and outcome is True for
+        a successfully handled interaction, False for a failure and None when the
+        record was skipped (Slack retry, duplicate or unparsable body).
+    """
+    receipt_handle = None
+    slack_body = None
+    message_processed_successfully = False
+    outcome = False
+    message_id = record.get("messageId")
+
+    try:
+        # 1. Parse SQS message to get Slack payload
+        slack_body, headers, receipt_handle = parse_sqs_message(record)
+
+        if not receipt_handle:
+            logger.error(
+                "Failed to get receipt handle for message %s. Record is malformed.",
+                message_id,
+            )
+            # Treat malformed records as 'processed' so they are not retried forever
+            message_processed_successfully = True
+            return message_id, message_processed_successfully, outcome
+
+        # If parse_sqs_message returned None body, it might be a retry or parse error
+        if slack_body is None:
+            # If it was a retry (headers present), mark as processed so it is not retried
+            if headers and headers.get("x-slack-retry-num"):
+                logger.info(
+                    "Ignoring Slack retry message %s. Marking as processed.",
+                    receipt_handle,
+                )
+            else:
+                # Actual parsing error occurred, log already happened in parse_sqs_message
+                logger.error(
+                    "Failed to parse Slack body from SQS message %s. Cannot process.",
+                    receipt_handle,
+                )
+            # Treat retries and parse errors as 'processed' to avoid infinite loops
+            message_processed_successfully = True
+            outcome = None
+            return message_id, message_processed_successfully, outcome
+
+        # Already handled by this container (SQS/Slack redelivery)
+        if slack_body is DUPLICATE_EVENT:
+            logger.info(
+                "Skipping duplicate Slack event in message %s. Marking as processed.",
+                receipt_handle,
+            )
+            message_processed_successfully = True
+            outcome = None
+            return message_id, message_processed_successfully, outcome
+
+        # 2. Handle the extracted Slack interaction
+        slack_client = _get_slack_client()
+        if not slack_client:
+            logger.error(
+                "Skipping message %s processing because Slack client is not initialized.",
+                receipt_handle,
+            )
+            # Do not mark as processed, let it retry or go to DLQ
+            return message_id, message_processed_successfully, outcome
+
+        logger.info(
+            "Dispatching Slack interaction type '%s' for message %s...",
+            slack_body.get("type"),
+            receipt_handle,
+        )
+        # Returning normally means the message is done (even if functionally failed);
+        # only HandlerCriticalError or an unexpected exception leaves it for retry.
+        handle_slack_interaction(slack_body, slack_client)
+        logger.info("Successfully dispatched handler for message %s.", receipt_handle)
+        message_processed_successfully = outcome = True
+
+    except HandlerCriticalError as e:
+        logger.error(
+            "Handler failed to process Slack interaction for message %s: %s",
+            receipt_handle,
+            e,
+        )
+
+    except Exception as e:
+        # Catch unexpected errors for a single record
+        logger.exception(
+            "Critical error processing SQS record (ReceiptHandle: %s): %s",
+            receipt_handle,
+            e,
+        )
+        # message_processed_successfully remains False, message will be retried
+
+    finally:
+        # 3. Report the message back to SQS for retry if it was not processed
+        if not message_processed_successfully:
+            logger.warning(
+                "Message %s was not processed successfully, will be retried.",
+                message_id,
+            )
+            # Let the retried delivery through the duplicate check
+            forget_slack_event(slack_body)
+
+    return message_id, message_processed_successfully, outcome
+
 
 # --- Main Lambda Handler ---
 
@@ -37,118 +173,35 @@ def lambda_handler(event, context):
     """
     AWS Lambda handler function triggered by SQS events.
     Processes Slack interaction payloads received via SQS.
+
+    Records of a batch are processed concurrently, since each one mostly waits
+    on Slack/GitHub I/O.
+
+    Returns a partial batch response: only the records listed in
+    batchItemFailures are retried, the rest are deleted by the Lambda service.
+    Requires ReportBatchItemFailures on the SQS event source mapping.
     """
     # Basic checks for essential configuration
-    if not slack_client:
+    if not SLACK_BOT_OAUTH_TOKEN:
         logger.critical("Slack client is not available. Cannot process messages.")
         # Potentially return error immediately, or let processing fail per message
         # For SQS, it's better to let it fail per message if possible
         pass  # Allow loop to run, failures will be logged per message
+    else:
+        # Create the client up front so worker threads share one instance
+        _get_slack_client()
 
-    if not SQS_QUEUE_URL:
-        logger.critical("SQS_QUEUE_URL is not configured. Cannot delete messages.")
-        # SQS processing might proceed, but deletion will fail
-
-    processed_count = 0
-    failed_count = 0
+    records = event.get("Records", [])
+    logger.info("Received %d SQS records.", len(records))
 
-    logger.info(f"Received {len(event.get('Records', []))} SQS records.")
+    # Results come back in record order
+    results = list(_EXECUTOR.map(_process_record, records))
 
-    for record in event.get("Records", []):
-        receipt_handle = None
-        message_processed_successfully = False
-
-        try:
-            # 1. Parse SQS message to get Slack payload
-            slack_body, headers, receipt_handle = parse_sqs_message(record)
-
-            if not receipt_handle:
-                logger.error(
-                    "Failed to get receipt handle for a message. It cannot be deleted."
-                )
-                # Continue to next message? Or is this record malformed?
-                failed_count += 1
-                continue
-
-            # If parse_sqs_message returned None body, it might be a retry or parse error
-            if slack_body is None:
-                # If it was a retry (headers present), mark as processed to delete
-                if headers and headers.get("x-slack-retry-num"):
-                    logger.info(
-                        f"Ignoring Slack retry message {receipt_handle}. Marking as processed."
-                    )
-                    message_processed_successfully = True
-                else:
-                    # Actual parsing error occurred, log already happened in parse_sqs_message
-                    logger.error(
-                        f"Failed to parse Slack body from SQS message {receipt_handle}. Cannot process."
-                    )
-                    # Decide if this should count as failure or just unprocessable message
-                    message_processed_successfully = True  # Treat parse errors as 'processed' to avoid infinite loops
-                # Skip further handling for this record
-            else:
-                # 2. Handle the extracted Slack interaction
-                if not slack_client:
-                    logger.error(
-                        f"Skipping message {receipt_handle} processing because Slack client is not initialized."
-                    )
-                    # Do not mark as processed, let it retry or go to DLQ
-                    failed_count += 1
-                else:
-                    logger.info(
-                        f"Dispatching Slack interaction type '{slack_body.get('type')}' for message {receipt_handle}..."
-                    )
-                    # handle_slack_interaction returns True if processing (even if functionally failed) completed
-                    # and the SQS message should be deleted. False means a critical error occurred during handling.
-                    message_processed_successfully = handle_slack_interaction(
-                        slack_body, slack_client
-                    )
-                    if message_processed_successfully:
-                        logger.info(
-                            f"Successfully dispatched handler for message {receipt_handle}."
-                        )
-                        processed_count += 1
-                    else:
-                        logger.error(
-                            f"Handler failed to process Slack interaction for message {receipt_handle}."
-                        )
-                        failed_count += 1
-
-        except Exception as e:
-            # Catch unexpected errors during the loop iteration for a single record
-            logger.exception(
-                f"Critical error processing SQS record (ReceiptHandle: {receipt_handle}): {e}"
-            )
-            failed_count += 1
-            # message_processed_successfully remains False, message won't be deleted
-
-        finally:
-            # 3. Delete message from SQS if processed successfully
-            if message_processed_successfully and receipt_handle and SQS_QUEUE_URL:
-                try:
-                    sqs.delete_message(
-                        QueueUrl=SQS_QUEUE_URL, ReceiptHandle=receipt_handle
-                    )
-                    logger.info(
-                        f"Successfully deleted message {receipt_handle} from SQS."
-                    )
-                except Exception as del_err:
-                    logger.error(
-                        f"Failed to delete message {receipt_handle} from SQS: {del_err}"
-                    )
-                    # Log error, but processing might have succeeded. This message might be reprocessed.
-            elif not receipt_handle:
-                logger.warning(
-                    "No receipt handle found for a processed record, cannot delete."
-                )
-            elif not message_processed_successfully:
-                logger.warning(
-                    f"Message {receipt_handle} was not processed successfully, will not delete."
-                )
-            elif not SQS_QUEUE_URL:
-                logger.error(
-                    f"SQS_QUEUE_URL not set, cannot delete message {receipt_handle}."
-                )
+    processed_count = sum(1 for _, _, outcome in results if outcome is True)
+    failed_count = sum(1 for _, _, outcome in results if outcome is False)
+    failed_message_ids = [
+        message_id for message_id, processed, _ in results if not processed
+    ]
 
     # Return summary response
     summary_message = (
@@ -156,6 +209,30 @@ def lambda_handler(event, context):
     )
     logger.info(summary_message)
     return {
-        "statusCode": 200,  # Lambda executed successfully, even if some messages failed
-        "body": json.dumps({"message": summary_message}),
+        "batchItemFailures": [
+            {"itemIdentifier": message_id} for message_id in failed_message_ids
+        ]
     }
+
+
+# --- Analysis Lambda Handler ---
+
+
+def analysis_lambda_handler(event, context):
+    """
+    AWS Lambda handler for the analysis function, invoked asynchronously
+    (InvocationType="Event") by trigger_arm_analysis when ANALYSIS_FN is set.
+    Runs the compatibility analysis and posts the result to the Slack thread.
+    """
+    channel_id = event.get("channel_id")
+    github_url = event.get("url")
+    if not channel_id or not github_url:
+        logger.error("Invalid analysis event, missing channel_id or url: %s", event)
+        return
+
+    slack_client = _get_slack_client()
+    if not slack_client:
+        logger.critical("Slack client is not available. Cannot post analysis results.")
+        return
+
+    run_arm_analysis(slack_client, channel_id, github_url, event.get("thread_ts"))
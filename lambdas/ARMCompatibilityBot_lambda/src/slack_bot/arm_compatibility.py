@@ -11,7 +11,7 @@ import logging
 from helpers.github_api import (
     get_repository_info,
     get_repository_tree,
-    get_file_content,
+    get_files_content,
 )
 from helpers.file_analyzer import (
     extract_instance_types_from_terraform_file,
@@ -24,35 +24,46 @@ from config import ENABLED_ANALYZERS  # Removed ENABLE_LLM as it wasn't used her
 
 logger = logging.getLogger()
 
-# Mapping from analyzer names to file patterns and analysis functions
+# Mapping from analyzer names to path matchers and analysis functions.
+# Matchers receive the lower-cased path so that matching ignores case.
 # Moved here for clarity within this module's context
 FILE_TYPE_ANALYZERS = {
     "terraform": {
-        "patterns": [r"\.tf$"],
+        "matcher": lambda path: path.endswith(".tf"),
         "analysis_key": "terraform_analysis",
         "analyzer": extract_instance_types_from_terraform_file,
     },
     "docker": {
-        "patterns": [
-            r"Dockerfile(\.\w+)?$",
-            r"/Dockerfile$",
-        ],  # Allow Dockerfile.dev etc.
+        "matcher": lambda path: (
+            path.endswith("dockerfile")
+            or path.rpartition("/")[2].rpartition(".")[0].endswith("dockerfile")
+        ),  # Allow Dockerfile.dev etc.
         "analysis_key": "dockerfile_analysis",
         "analyzer": parse_dockerfile_content,
     },
     "dependency": {
-        "patterns": [r"requirements\.txt$", r"package\.json$"],
+        "matcher": lambda path: path.endswith(("requirements.txt", "package.json")),
         "analysis_key": "dependency_analysis",
         "analyzer": extract_dependencies,  # This needs the file_type arg below
     },
 }
 
 
+# Path matchers of the analyzers enabled in config, in classification order
+ENABLED_FILE_MATCHERS = [
+    (name, FILE_TYPE_ANALYZERS[name]["matcher"])
+    for name, enabled in ENABLED_ANALYZERS.items()
+    if enabled and name in FILE_TYPE_ANALYZERS
+]
+
+
+# Allow optional .git suffix and trailing slash; scheme and host match case-insensitively
+_REPO_URL_RE = re.compile(r"https?://github\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$", re.IGNORECASE)
+
+
 def extract_repo_info(repo_url):
     """GitHub URL에서 소유자와 저장소 이름을 추출합니다."""
-    # Allow optional .git suffix and trailing slash
-    pattern = r"https?://github\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$"
-    match = re.match(pattern, repo_url.strip())
+    match = _REPO_URL_RE.match(repo_url.strip())
     if not match:
         raise ValueError(f"Invalid GitHub repository URL format: {repo_url}")
     return match.group(1), match.group(2)
@@ -110,19 +121,36 @@ def check_compatibility(github_url):
                 enabled_file_categories[analyzer_name] = {"config": config, "files": []}
 
         # Identify relevant files based *only* on enabled analyzers
+        blob_shas = {}  # path -> blob SHA, used as an immutable cache key for contents
         for item in tree.get("tree", []):
             if item.get("type") == "blob":
                 path = item["path"]
-                for analyzer_name, category_data in enabled_file_categories.items():
-                    for pattern in category_data["config"]["patterns"]:
-                        if re.search(
-                            pattern, path, re.IGNORECASE
-                        ):  # Ignore case for robustness
-                            category_data["files"].append(path)
-                            logger.debug(
-                                f"Found relevant file '{path}' for analyzer '{analyzer_name}'"
-                            )
-                            break  # File matches this category, move to next file
+                blob_shas[path] = item.get("sha")
+                # Plain string checks on the lower-cased path (ignoring case for robustness)
+                lower_path = path.lower()
+                for analyzer_name, matcher in ENABLED_FILE_MATCHERS:
+                    if matcher(lower_path):
+                        enabled_file_categories[analyzer_name]["files"].append(path)
+                        logger.debug(
+                            f"Found relevant file '{path}' for analyzer '{analyzer_name}'"
+                        )
+                        break
+
+        # Fetch all identified files concurrently before analyzing them
+        all_paths = [
+            path
+            for category_data in enabled_file_categories.values()
+            for path in category_data["files"]
+        ]
+        all_shas = [blob_shas[path] for path in all_paths]
+        contents = dict(
+            zip(
+                all_paths,
+                get_files_content(
+                    owner, repo, all_paths, default_branch, shas=all_shas
+                ),
+            )
+        )
 
         # Analyze the identified files
         total_files_analyzed = 0
@@ -136,7 +164,7 @@ def check_compatibility(github_url):
             )
             for file_path in category_data["files"]:
                 try:
-                    content = get_file_content(owner, repo, file_path, default_branch)
+                    content = contents[file_path]
                     if content is not None:  # Ensure content was fetched
                         total_files_analyzed += 1
                         analysis_output = None
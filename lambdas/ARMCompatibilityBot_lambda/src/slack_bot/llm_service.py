@@ -111,10 +111,10 @@ def summarize_analysis_with_llm(compatibility_result: Dict[str, Any]) -> str:
         # print(llm.invoke("안녕하세요"))
 
         # Invoke the chain
-        print(f"compatibility_result: ", compatibility_result)
+        logger.debug("compatibility_result: %s", compatibility_result)
         summary = chain.invoke({"compatibility_result_json": compatibility_result, "language": LLM_LANGUAGE})
         logger.info("LLM summary generated successfully.")
-        print(summary)
+        logger.debug("LLM summary: %s", summary)
         return summary
 
     except Exception as e:
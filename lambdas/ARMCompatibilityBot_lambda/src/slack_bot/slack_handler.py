@@ -1,6 +1,7 @@
 import logging
 import re
 import json # Import json for potential debugging if needed
+import threading
 from slack_sdk import WebClient
 from typing import Dict, Any, Optional
 
@@ -16,23 +17,91 @@ from .slack_utils import (
         format_unknown_command_blocks,
         format_missing_url_blocks, # Added missing import
     )
-from .arm_compatibility import (
-    check_compatibility,
-)
-from config import ENABLE_LLM # Import ENABLE_LLM flag
+from config import ENABLE_LLM, ANALYSIS_FUNCTION_NAME # Import ENABLE_LLM flag and analysis Lambda name
 from .llm_service import summarize_analysis_with_llm # Import the LLM summarizer
 
 
+class HandlerCriticalError(Exception):
+    """Raised when a Slack interaction cannot be processed and its SQS message should be retried."""
+
+
+# --- Mention Parsing Patterns ---
+# Case-insensitive so the mention text can be matched as-is (no lowercased copy)
+_GITHUB_URL_RE = re.compile(r"https?://github\.com/[^/\s>|]+/[^/\s>|]+", re.IGNORECASE)
+_ANALYZE_RE = re.compile(r"analyze|분석|check|확인", re.IGNORECASE)
+_HELP_RE = re.compile(r"help|도움말", re.IGNORECASE)
+
 
 # --- Analysis Trigger Function ---
 
+_lambda_client = None
+# SQS records are handled in parallel threads, and boto3.client() on the default session is not thread-safe
+_lambda_client_lock = threading.Lock()
+
+
+class DispatchNotSentError(Exception):
+    """Raised when the analysis invoke failed before the request reached Lambda, so running inline is safe."""
+
+
+def _get_lambda_client():
+    """Returns a cached boto3 Lambda client, importing boto3 only when analysis is dispatched."""
+    global _lambda_client
+    if _lambda_client is None:
+        with _lambda_client_lock:
+            if _lambda_client is None:
+                import boto3
+                from botocore.config import Config
+
+                # Keep the connection alive across warm invocations and retry throttled dispatches
+                _lambda_client = boto3.client(
+                    "lambda",
+                    config=Config(
+                        tcp_keepalive=True,
+                        retries={"max_attempts": 3, "mode": "adaptive"},
+                        connect_timeout=2,
+                        read_timeout=5,
+                    ),
+                )
+    return _lambda_client
+
+
+def dispatch_arm_analysis(channel_id: str, github_url: str, thread_ts: Optional[str]):
+    """
+    Invokes the analysis Lambda asynchronously so the SQS handler can return right after the ack.
+
+    Raises:
+        DispatchNotSentError: If the invoke failed before it was sent (client setup, parameter
+            validation or connection errors). Other errors may come after Lambda queued the event.
+    """
+    try:
+        lambda_client = _get_lambda_client()
+        from botocore.exceptions import (
+            ConnectTimeoutError,
+            EndpointConnectionError,
+            NoCredentialsError,
+            ParamValidationError,
+        )
+    except Exception as e:
+        raise DispatchNotSentError(f"Lambda client unavailable: {e}") from e
+
+    payload = {"channel_id": channel_id, "url": github_url, "thread_ts": thread_ts}
+    try:
+        lambda_client.invoke(
+            FunctionName=ANALYSIS_FUNCTION_NAME,
+            InvocationType="Event",
+            Payload=json.dumps(payload).encode("utf-8"),
+        )
+    except (ParamValidationError, EndpointConnectionError, ConnectTimeoutError, NoCredentialsError) as e:
+        raise DispatchNotSentError(str(e)) from e
+
+
 def trigger_arm_analysis(
     client: WebClient,
     channel_id: str,
     github_url: str,
     thread_ts: Optional[str] = None,
 ):
-    """Sends ack, performs analysis, generates summary (LLM or basic), and sends results/error back."""
+    """Sends ack, then hands the analysis to the analysis Lambda (or runs it inline if none is configured)."""
     ack_blocks = format_ack_blocks(github_url)
     ack_fallback_text = f"Starting analysis for {github_url}..."
     ack_message_ts = send_slack_block_message(
@@ -41,18 +110,52 @@ def trigger_arm_analysis(
 
     result_thread_ts = ack_message_ts or thread_ts
 
+    if ANALYSIS_FUNCTION_NAME:
+        try:
+            dispatch_arm_analysis(channel_id, github_url, result_thread_ts)
+            logger.info("Dispatched analysis for %s to %s", github_url, ANALYSIS_FUNCTION_NAME)
+            return
+        except DispatchNotSentError as dispatch_error:
+            logger.exception("Failed to dispatch analysis for %s, running inline: %s", github_url, dispatch_error)
+        except Exception as dispatch_error:
+            # The invoke may already be queued (e.g. read timeout after Lambda accepted it),
+            # so running inline could post the results twice; report the error instead
+            logger.exception("Analysis dispatch for %s may or may not have been accepted: %s", github_url, dispatch_error)
+            error_blocks = format_error_blocks(
+                github_url,
+                f"Could not confirm that the analysis was started ({type(dispatch_error).__name__}). "
+                "If no result appears in this thread, please ask again.",
+            )
+            send_slack_block_message(
+                client, channel_id, error_blocks, f"❌ 분석 요청 확인 실패 ({github_url})", thread_ts=result_thread_ts
+            )
+            return
+
+    run_arm_analysis(client, channel_id, github_url, result_thread_ts)
+
+
+def run_arm_analysis(
+    client: WebClient,
+    channel_id: str,
+    github_url: str,
+    result_thread_ts: Optional[str] = None,
+):
+    """Performs analysis, generates summary (LLM or basic), and sends results/error back."""
+    # Imported here so help/unknown-command cold starts skip loading the analyzers
+    from .arm_compatibility import check_compatibility
+
     try:
-        logger.info(f"Starting check_compatibility for: {github_url}")
+        logger.info("Starting check_compatibility for: %s", github_url)
         # analysis_output contains 'repository', 'github_url', and 'compatibility_result' or 'error'
         analysis_output = check_compatibility(github_url)
-        logger.info(f"Finished check_compatibility for: {github_url}")
+        logger.info("Finished check_compatibility for: %s", github_url)
 
         result_blocks = None
         fallback_text = ""
 
         if "error" in analysis_output:
             # --- Handle Analysis Error ---
-            logger.error(f"Analysis failed for {github_url}: {analysis_output['error']}")
+            logger.error("Analysis failed for %s: %s", github_url, analysis_output['error'])
             result_blocks = format_error_blocks(github_url, analysis_output["error"])
             fallback_text = f"❌ ARM 호환성 분석 중 오류 발생: {github_url}"
 
@@ -83,7 +186,7 @@ def trigger_arm_analysis(
                 logger.info("LLM summarization successful.")
 
             except Exception as llm_err:
-                logger.error(f"LLM summarization failed: {llm_err}. Falling back to basic results format.", exc_info=True)
+                logger.error("LLM summarization failed: %s. Falling back to basic results format.", llm_err, exc_info=True)
                 # Fallback to the original formatting function if LLM fails
                 result_blocks = format_analysis_results_blocks(
                     github_url, analysis_output["compatibility_result"]
@@ -114,7 +217,7 @@ def trigger_arm_analysis(
             )
         else:
             # Should not happen if error handling and fallbacks are correct, but just in case
-            logger.error(f"Failed to generate any result blocks for {github_url}")
+            logger.error("Failed to generate any result blocks for %s", github_url)
             send_slack_block_message(
                 client, channel_id, [{"type": "section", "text": {"type": "mrkdwn", "text": "알 수 없는 오류로 분석 결과를 생성하지 못했습니다."}}], "Analysis Error", thread_ts=result_thread_ts
             )
@@ -122,7 +225,7 @@ def trigger_arm_analysis(
 
     except Exception as analysis_error:
         # Catch unexpected errors during the check_compatibility call or result processing
-        logger.exception(f"Critical error during analysis process for {github_url}: {analysis_error}")
+        logger.exception("Critical error during analysis process for %s: %s", github_url, analysis_error)
         error_blocks = format_error_blocks(github_url, f"전체 분석 프로세스 실패: {analysis_error}")
         fallback_text = f"❌ 심각한 오류 발생 ({github_url})"
         send_slack_block_message(
@@ -132,61 +235,41 @@ def trigger_arm_analysis(
 # --- Event Handlers ---
 
 
-def handle_view_submission(body: Dict[str, Any], client: WebClient) -> bool:
+def handle_view_submission(body: Dict[str, Any], client: WebClient) -> None:
     """Handles submissions from modal views."""
-    view_payload = body.get("view", {})
-    callback_id = view_payload.get("callback_id")
-    user_id = body.get("user", {}).get("id")
-
-    # Removed handling for 'github_repo_modal_submitted'
-
-    # --- Add handlers for *other* potential future modals here ---
-    # Example:
-    # if callback_id == "some_other_modal":
-    #    # Do something
-    #    logger.info(f"Handling view submission for {callback_id} by user {user_id}")
-    #    # ... processing logic ...
-    #    return True
+    # Removed handling for 'github_repo_modal_submitted'.
+    # No modals are registered, so acknowledge right away.
+    # When adding one, dispatch on body["view"]["callback_id"] through a table like _DISPATCH.
+    logger.debug("view_submission currently has no registered handlers")
 
-    logger.warning(f"Unhandled view submission callback_id: {callback_id}")
-    # Return True to acknowledge the event and prevent SQS retries, even if unhandled.
-    return True
 
-
-def handle_block_actions(body: Dict[str, Any], client: WebClient) -> bool:
+def handle_block_actions(body: Dict[str, Any], client: WebClient) -> None:
     """Handles actions within message blocks (e.g., button clicks)."""
-    actions = body.get("actions", [])
-    user_id = body.get("user", {}).get("id")  # User who clicked
-
-    action_handled = False  # Track if a specific action was processed
-    for action in actions:
-        action_id = action.get("action_id")
-        logger.info(f"Processing action_id: {action_id} from user {user_id}")
+    # Removed handling for 'open_github_repo_modal'.
+    # No block actions are registered, so acknowledge right away.
+    # When adding one, dispatch on each action's action_id through a table like _DISPATCH.
+    logger.debug("block_actions currently have no registered handlers")
 
-        # Removed handling for 'open_github_repo_modal'
 
-        # --- Add handlers for *other* potential future actions here ---
-        # Example:
-        # if action_id == "some_other_action":
-        #     # Do something
-        #     action_handled = True
-        #     break
+_bot_name = None
 
-    if not action_handled:
-        logger.warning(f"No specific handler found for block actions: {actions}")
 
-    # Return True to acknowledge the block_actions event itself, preventing SQS retries
-    # even if no specific action was matched/handled.
-    return True
+def _get_bot_name(client: WebClient) -> str:
+    """Returns the bot's mention string, calling auth.test only once per container."""
+    global _bot_name
+    if _bot_name is None:
+        bot_user_id = client.auth_test().get("user_id", "bot") # Get bot's own user ID for mentions
+        _bot_name = f"<@{bot_user_id}>" # Use mention format
+    return _bot_name
 
 
-def handle_app_mention(event_data: Dict[str, Any], client: WebClient) -> bool:
+def handle_app_mention(event_data: Dict[str, Any], client: WebClient) -> None:
     """Handles 'app_mention' events."""
     if event_data.get("bot_id"):
         logger.info("Ignoring mention event from a bot.")
-        return True
+        return
 
-    text = event_data.get("text", "").lower()
+    text = event_data.get("text", "")
     channel_id = event_data.get("channel")
     user_id = event_data.get("user")
     mention_message_ts = event_data.get("ts")
@@ -194,67 +277,75 @@ def handle_app_mention(event_data: Dict[str, Any], client: WebClient) -> bool:
     target_thread_ts = original_thread_ts or mention_message_ts
 
     if not channel_id or not user_id or not mention_message_ts:
-        logger.error(f"Missing crucial data in app_mention event: {event_data}")
-        return False # Indicate processing failure
+        raise HandlerCriticalError(f"Missing crucial data in app_mention event: {event_data}")
 
-    github_url_pattern = r"https?://github\.com/[^/\s]+/[^/\s>\|]+"
-    github_url_match = re.search(github_url_pattern, text)
+    github_url_match = _GITHUB_URL_RE.search(text)
 
-    bot_user_id = client.auth_test().get("user_id", "bot") # Get bot's own user ID for mentions
-    bot_name = f"<@{bot_user_id}>" # Use mention format
+    bot_name = _get_bot_name(client) # Bot's own mention, used in the help texts
 
-    if "analyze" in text or "분석" in text or "check" in text or "확인" in text:
+    if _ANALYZE_RE.search(text):
         if github_url_match:
             github_url = github_url_match.group(0).rstrip(">")
-            logger.info(f"AppMention: User {user_id} requested analysis for {github_url} in channel {channel_id}")
+            logger.info("AppMention: User %s requested analysis for %s in channel %s", user_id, github_url, channel_id)
             trigger_arm_analysis(client, channel_id, github_url, thread_ts=target_thread_ts)
         else:
-            logger.info(f"AppMention: User {user_id} requested analysis without URL in channel {channel_id}")
+            logger.info("AppMention: User %s requested analysis without URL in channel %s", user_id, channel_id)
             missing_url_blocks = format_missing_url_blocks(user_id, bot_name) # Pass bot_name
             send_slack_block_message(
                 client, channel_id, missing_url_blocks, "GitHub 레포지토리 URL을 제공해주세요.", thread_ts=target_thread_ts
             )
-        return True # Handled
-
 
-    elif "help" in text or "도움말" in text:
-        logger.info(f"AppMention: User {user_id} requested help in channel {channel_id}")
+    elif _HELP_RE.search(text):
+        logger.info("AppMention: User %s requested help in channel %s", user_id, channel_id)
         help_blocks = format_help_blocks(bot_name) # Pass bot_name
         send_slack_block_message(
             client, channel_id, help_blocks, "도움말 정보", thread_ts=target_thread_ts
         )
-        return True # Handled
 
     else:
-        logger.info(f"AppMention: User {user_id} sent unknown command in channel {channel_id}")
+        logger.info("AppMention: User %s sent unknown command in channel %s", user_id, channel_id)
         unknown_blocks = format_unknown_command_blocks(user_id, bot_name) # Pass bot_name
         send_slack_block_message(
             client, channel_id, unknown_blocks, "알 수 없는 명령어", thread_ts=target_thread_ts
         )
-        return True # Handled (acknowledged as unknown)
 
 
-def handle_event_callback(body: Dict[str, Any], client: WebClient) -> bool:
+def handle_event_callback(body: Dict[str, Any], client: WebClient) -> None:
     """Handles 'event_callback' events by dispatching to specific event handlers."""
     event_data = body.get("event", {})
     event_type = event_data.get("type")
 
     if event_type == "app_mention":
-        return handle_app_mention(event_data, client)
+        handle_app_mention(event_data, client)
+        return
     # Add elif for other event types like 'message' if needed in the future
     # elif event_type == "message":
     #     # Handle direct messages or other message events
     #     pass
 
-    logger.warning(f"Unhandled event_callback event type: {event_type}")
-    # Return True to ack event and prevent SQS retries, even if unhandled type
-    return True
+    # Unhandled types are still acknowledged, so SQS does not retry them
+    logger.warning("Unhandled event_callback event type: %s", event_type)
+
+
+def handle_url_verification_attempt(body: Dict[str, Any], client: WebClient) -> None:
+    """Handles the url_verification marker set by parse_sqs_message."""
+    logger.warning(
+        "Acknowledging url_verification attempt received via SQS, but cannot respond correctly."
+    )
 
 
 # --- Main Dispatcher ---
 
+# Interaction type -> handler
+_DISPATCH = {
+    "view_submission": handle_view_submission,
+    "block_actions": handle_block_actions,
+    "event_callback": handle_event_callback,  # Event API events (like app_mention)
+    "url_verification_attempt": handle_url_verification_attempt,  # Specific marker from parse_sqs_message
+}
+
 
-def handle_slack_interaction(slack_body: Dict[str, Any], client: WebClient) -> bool:
+def handle_slack_interaction(slack_body: Dict[str, Any], client: WebClient) -> None:
     """
     Main dispatcher for incoming Slack interaction payloads (parsed from SQS).
 
@@ -262,37 +353,21 @@ def handle_slack_interaction(slack_body: Dict[str, Any], client: WebClient) -> b
         slack_body: The parsed Slack payload dictionary.
         client: The initialized Slack WebClient.
 
-    Returns:
-        True if the interaction was successfully processed (or acknowledged), False otherwise.
-        This indicates if the SQS message should be deleted.
+    Returning normally means the interaction was processed (or acknowledged) and the
+    SQS message can be deleted.
+
+    Raises:
+        HandlerCriticalError: If the interaction could not be processed and the SQS
+            message should be retried.
     """
     interaction_type = slack_body.get("type")
-    logger.info(f"Handling Slack interaction of type: {interaction_type}")
-
-    processed_successfully = False
-    if interaction_type == "view_submission":
-        processed_successfully = handle_view_submission(slack_body, client)
-
-    elif interaction_type == "block_actions":
-        processed_successfully = handle_block_actions(slack_body, client)
-
-    elif interaction_type == "event_callback":
-        # Event API events (like app_mention)
-        processed_successfully = handle_event_callback(slack_body, client)
+    logger.info("Handling Slack interaction of type: %s", interaction_type)
 
-    elif interaction_type == "url_verification_attempt":
-        # Specific marker from parse_sqs_message
+    handler = _DISPATCH.get(interaction_type)
+    if handler is None:
         logger.warning(
-            "Acknowledging url_verification attempt received via SQS, but cannot respond correctly."
-        )
-        processed_successfully = True  # Treat as processed to delete SQS message
-
-    else:
-        logger.warning(
-            f"Unhandled Slack interaction type: {interaction_type}. Payload: {str(slack_body)[:500]}"
-        )
-        processed_successfully = (
-            True  # Mark as processed to prevent SQS retries for unknown types
+            "Unhandled Slack interaction type: %s. Payload: %s", interaction_type, str(slack_body)[:500]
         )
+        return  # Acknowledged, so unknown types are not retried
 
-    return processed_successfully
+    handler(slack_body, client)
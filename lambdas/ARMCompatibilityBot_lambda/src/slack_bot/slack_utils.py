@@ -1,5 +1,6 @@
 # slack_bot/slack_utils.py
 import logging
+from functools import lru_cache
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 from typing import List, Dict, Any, Optional
@@ -102,7 +103,7 @@ def format_analysis_results_blocks(
         else "❓" if overall_compatibility == "unknown" else "❌"
     )
     summary_text = f"{icon} *ARM Compatibility Analysis for {repo_display}: {overall_compatibility.capitalize()}*"
-    print(f"summary_text: {summary_text}")
+    logger.debug("summary_text: %s", summary_text)
     suggestions.append(
         {"type": "section", "text": {"type": "mrkdwn", "text": summary_text}}
     )
@@ -217,8 +218,9 @@ def format_ack_blocks(github_url: str) -> List[Dict[str, Any]]:
     ]
 
 
+@lru_cache(maxsize=4)
 def format_help_blocks(bot_name: str = "bot") -> List[Dict[str, Any]]:
-    """Formats the help message into Slack blocks."""
+    """Formats the help message into Slack blocks (cached and shared, do not mutate)."""
     return [
         {
             "type": "section",
@@ -234,10 +236,11 @@ def format_help_blocks(bot_name: str = "bot") -> List[Dict[str, Any]]:
     ]
 
 
+@lru_cache(maxsize=64)
 def format_unknown_command_blocks(
     user_id: str, bot_name: str = "bot"
 ) -> List[Dict[str, Any]]:
-    """Formats the unknown command message."""
+    """Formats the unknown command message (cached and shared, do not mutate)."""
     return [
         {
             "type": "section",
@@ -252,10 +255,11 @@ def format_unknown_command_blocks(
 # Removed format_ask_for_repo_blocks
 
 
+@lru_cache(maxsize=64)
 def format_missing_url_blocks(
     user_id: str, bot_name: str = "bot"
 ) -> List[Dict[str, Any]]:
-    """Formats a message indicating a missing URL when requesting analysis."""
+    """Formats a message indicating a missing URL when requesting analysis (cached and shared, do not mutate)."""
     return [
         {
             "type": "section",
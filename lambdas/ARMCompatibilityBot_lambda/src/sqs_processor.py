@@ -1,11 +1,51 @@
 # sqs_processor.py
 import json
+import re
 import urllib.parse
 import logging
+import threading
+from collections import OrderedDict
 from typing import Tuple, Dict, Any, Optional
 
+# orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError,
+# so the error handling below works with either parser
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 logger = logging.getLogger()
 
+# Slack retry header in the raw SQS body, checked before any JSON decoding
+_RETRY_HEADER_RE = re.compile(r'"x-slack-retry-num"\s*:\s*"?(\d+)')
+
+# Recently seen Slack event_id/trigger_id values, kept across warm invocations
+# so duplicate deliveries of the same event are skipped
+SEEN_EVENTS_MAX = 256
+_SEEN_EVENTS: "OrderedDict[str, None]" = OrderedDict()
+# Records of a batch are parsed from several threads
+_SEEN_EVENTS_LOCK = threading.Lock()
+
+# Returned as the Slack body for duplicate deliveries, so callers can tell them
+# apart from parse failures (compare by identity)
+DUPLICATE_EVENT: Dict[str, Any] = {"type": "duplicate_event"}
+
+
+def _slack_event_key(slack_body: Dict[str, Any]) -> Optional[str]:
+    """Returns the identifier Slack keeps stable across redeliveries, if any."""
+    return slack_body.get("event_id") or slack_body.get("trigger_id")
+
+
+def forget_slack_event(slack_body: Optional[Dict[str, Any]]) -> None:
+    """
+    Removes an event from the duplicate cache, so a redelivery of a message
+    whose processing failed is handled again instead of being skipped.
+    """
+    key = _slack_event_key(slack_body) if slack_body else None
+    if key:
+        with _SEEN_EVENTS_LOCK:
+            _SEEN_EVENTS.pop(key, None)
+
 
 def parse_sqs_message(
     record: Dict[str, Any],
@@ -18,7 +58,8 @@ def parse_sqs_message(
 
     Returns:
         A tuple containing:
-        - The parsed Slack body dictionary (or None if parsing fails).
+        - The parsed Slack body dictionary (None if parsing fails or the message
+          is a Slack retry, DUPLICATE_EVENT if the event was already seen).
         - The original request headers dictionary (or None).
         - The SQS message receipt handle (or None).
     """
@@ -29,10 +70,18 @@ def parse_sqs_message(
             logger.warning("SQS record has no body.")
             return None, None, receipt_handle
 
-        original_request_payload = json.loads(sqs_body_str)
+        # Fast path: skip Slack retries without decoding the message
+        retry_match = _RETRY_HEADER_RE.search(sqs_body_str)
+        if retry_match:
+            logger.info(
+                f"Slack retry detected (Attempt {retry_match.group(1)}). Skipping."
+            )
+            return None, {"x-slack-retry-num": retry_match.group(1)}, receipt_handle
+
+        original_request_payload = json_loads(sqs_body_str)
         headers = original_request_payload.get("headers", {})
 
-        # Check for Slack retries
+        # Check for Slack retries (fallback for header layouts the fast path misses)
         if headers.get("x-slack-retry-num"):
             logger.info(
                 f"Slack retry detected (Attempt {headers.get('x-slack-retry-num')}). Skipping."
@@ -40,6 +89,9 @@ def parse_sqs_message(
             return None, headers, receipt_handle  # Return None for body to signal skip
 
         body_str = original_request_payload.get("body", "")
+        # Only headers and body are needed; drop the outer payload (the raw SQS
+        # body string itself stays owned by the record)
+        del original_request_payload
         if not body_str:
             logger.warning(
                 "Original request payload in SQS message has no 'body' field."
@@ -48,16 +100,18 @@ def parse_sqs_message(
 
         # Parse Slack's body content
         slack_body = None
-        if "payload=" in body_str and body_str.startswith("payload="):
-            # Interaction payload (e.g., modal submit, button click)
-            parsed_qs = urllib.parse.parse_qs(body_str)
-            payload_str = parsed_qs.get("payload", [None])[0]
+        if body_str.startswith("payload="):
+            # Interaction payload (e.g., modal submit, button click): decode only the payload value
+            payload_str = urllib.parse.unquote_plus(
+                body_str[len("payload=") :].partition("&")[0]
+            )
             if payload_str:
-                slack_body = json.loads(payload_str)
+                slack_body = json_loads(payload_str)
+            del payload_str
         else:
             # Event payload (e.g., app_mention) or potentially other formats
             try:
-                slack_body = json.loads(body_str)
+                slack_body = json_loads(body_str)
             except json.JSONDecodeError:
                 logger.error(
                     f"Failed to decode JSON body from original request: {body_str[:200]}..."
@@ -71,10 +125,25 @@ def parse_sqs_message(
                     # For now, treat as unprocessable JSON
                     slack_body = {"type": "url_verification_attempt"}  # Mark it
 
+        # The decoded slack_body replaces the (possibly large) encoded body
+        del body_str
+
         if slack_body is None:
             logger.warning("Could not parse Slack body from original request.")
             return None, headers, receipt_handle
 
+        # Skip events already handled by this container (e.g. SQS/Slack redeliveries)
+        event_key = _slack_event_key(slack_body)
+        if event_key:
+            with _SEEN_EVENTS_LOCK:
+                is_duplicate = event_key in _SEEN_EVENTS
+                if not is_duplicate:
+                    _SEEN_EVENTS[event_key] = None
+                    if len(_SEEN_EVENTS) > SEEN_EVENTS_MAX:
+                        _SEEN_EVENTS.popitem(last=False)
+            if is_duplicate:
+                return DUPLICATE_EVENT, headers, receipt_handle
+
         logger.info(f"Successfully parsed Slack event type: {slack_body.get('type')}")
         return slack_body, headers, receipt_handle
 
@@ -1,7 +1,6 @@
 import json
 import os
 import logging
-import boto3
 import time
 import hmac
 import hashlib
@@ -14,6 +13,39 @@ logger.setLevel(logging.DEBUG)
 SQS_QUEUE_URL = os.environ.get("SQS_QUEUE_URL")
 SLACK_SIGNING_SECRET = os.environ.get("SLACK_SIGNING_SECRET")
 
+# 웜 스타트 간에 재사용되는 SQS 클라이언트 (최초 사용 시 생성)
+_sqs_client = None
+
+
+def _get_sqs_client():
+    """
+    SQS 클라이언트를 반환하는 함수.
+    boto3는 처음 호출될 때 import되므로, 서명 검증에 실패한 요청은 import 비용을 치르지 않습니다.
+    """
+    global _sqs_client
+    if _sqs_client is None:
+        import boto3
+        from botocore.config import Config
+
+        # SendMessage는 보통 수십 ms 안에 끝나므로 타임아웃은 1~1.5초로 두고 1회만 재시도합니다.
+        # - 최악의 경우 2회 x (1s + 1.5s)에 백오프(최대 1s)가 더해져 Slack의 3초 제한을 넘을 수 있습니다.
+        #   그래도 메시지가 전송되었다면 Slack의 재전송은 봇이 x-slack-retry-num 헤더로 건너뛰므로 무해합니다.
+        # - SQS가 메시지를 받은 뒤 읽기 타임아웃이 나면 재시도로 같은 이벤트가 두 번 들어갈 수 있습니다.
+        #   봇은 event_id로 중복을 건너뛰지만, 이 기록은 컨테이너별이라 완전히 막지는 못합니다.
+        # - 두 번 모두 실패하면 500을 반환합니다. Slack이 재전송하더라도 봇이 재전송 이벤트를
+        #   건너뛰므로 해당 멘션은 처리되지 않습니다.
+        # 연결을 유지해 웜 호출에서 TLS 핸드셰이크를 반복하지 않도록 합니다.
+        _sqs_client = boto3.client(
+            "sqs",
+            config=Config(
+                tcp_keepalive=True,
+                retries={"total_max_attempts": 2, "mode": "standard"},
+                connect_timeout=1,
+                read_timeout=1.5,
+            ),
+        )
+    return _sqs_client
+
 
 def validate_slack_signature(event):
     """
@@ -98,7 +130,7 @@ def lambda_handler(event, context):
         }
 
     # SQS 메시지 발행
-    client = boto3.client("sqs")
+    client = _get_sqs_client()
     message_to_send = json.dumps(event)
 
     try:
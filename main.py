@@ -4,7 +4,7 @@ import json
 from helpers.github_api import (
     get_repository_info,
     get_repository_tree,
-    get_file_content,
+    get_files_content,
 )
 from helpers.file_analyzer import (
     extract_instance_types_from_terraform_file,
@@ -20,30 +20,44 @@ from config import ENABLE_LLM, ENABLED_ANALYZERS
 # 파일 타입과 분석기 매핑 정의 - JavaScript 추가
 FILE_TYPE_ANALYZERS = {
     "terraform": {
-        "patterns": [r"\.tf$"],  # Terraform 파일 패턴
+        "matcher": lambda path: path.endswith(".tf"),  # Terraform 파일 패턴
         "analysis_key": "terraform_analysis",
         "analyzer": extract_instance_types_from_terraform_file,
     },
     "docker": {
-        "patterns": [r"Dockerfile$", r"/Dockerfile"],  # Dockerfile 패턴
+        # Dockerfile 패턴 - 파일 이름 기준 (Dockerfile, Dockerfile.dev, app.Dockerfile 등)
+        # 디렉터리 이름은 보지 않음 (예: Dockerfiles/requirements.txt는 의존성 파일)
+        "matcher": lambda path: (
+            path.endswith("Dockerfile")
+            or path.rpartition("/")[2].startswith("Dockerfile")
+        ),
         "analysis_key": "dockerfile_analysis",
         "analyzer": parse_dockerfile_content,
     },
     "dependency": {
-        "patterns": [
-            r"requirements\.txt$",
-            r"package\.json$",
-        ],  # 의존성 파일 패턴 - Python, JavaScript 추가
+        "matcher": lambda path: path.endswith(
+            ("requirements.txt", "package.json")
+        ),  # 의존성 파일 패턴 - Python, JavaScript 추가
         "analysis_key": "dependency_analysis",
         "analyzer": extract_dependencies,
     },
 }
 
 
+# Path matchers of the analyzers enabled in config, in classification order
+ENABLED_FILE_MATCHERS = [
+    (name, FILE_TYPE_ANALYZERS[name]["matcher"])
+    for name, enabled in ENABLED_ANALYZERS.items()
+    if enabled and name in FILE_TYPE_ANALYZERS
+]
+
+
+_REPO_URL_RE = re.compile(r"https?://github\.com/([^/]+)/([^/]+)")
+
+
 def extract_repo_info(repo_url):
     """Extract owner and repo from GitHub URL."""
-    pattern = r"https?://github\.com/([^/]+)/([^/]+)"
-    match = re.match(pattern, repo_url)
+    match = _REPO_URL_RE.match(repo_url)
     if not match:
         raise ValueError("Invalid GitHub repository URL")
     return match.group(1), match.group(2)
@@ -99,17 +113,24 @@ def analyze_repository(repo_url):
             results[FILE_TYPE_ANALYZERS[analyzer_name]["analysis_key"]] = []
 
     # Identify relevant files based on enabled analyzers
+    blob_shas = {}
     for item in tree.get("tree", []):
         if item["type"] == "blob":
             path = item["path"]
-
-            # 활성화된 분석기에 대해 파일 체크
-            for analyzer_name, category_info in file_categories.items():
-                analyzer_config = FILE_TYPE_ANALYZERS[analyzer_name]
-                for pattern in analyzer_config["patterns"]:
-                    if re.search(pattern, path):
-                        category_info.append(path)
-                        break
+            blob_shas[path] = item.get("sha")
+
+            # 활성화된 분석기의 문자열 매처로 체크 (첫 번째 일치 분석기에 할당)
+            for analyzer_name, matcher in ENABLED_FILE_MATCHERS:
+                if matcher(path):
+                    file_categories[analyzer_name].append(path)
+                    break
+
+    # Fetch all matched files concurrently before analyzing them
+    all_paths = [path for paths in file_categories.values() for path in paths]
+    all_shas = [blob_shas[path] for path in all_paths]
+    contents = dict(
+        zip(all_paths, get_files_content(owner, repo, all_paths, shas=all_shas))
+    )
 
     # Analyze files for each enabled analyzer
     for analyzer_name, file_paths in file_categories.items():
@@ -118,7 +139,7 @@ def analyze_repository(repo_url):
         analyzer_func = analyzer_config["analyzer"]
 
         for file_path in file_paths:
-            content = get_file_content(owner, repo, file_path)
+            content = contents[file_path]
             if content:
                 # 의존성 분석기는 파일 타입 인자가 필요하므로 특별 처리
                 if analyzer_name == "dependency":
@@ -176,55 +197,67 @@ def lambda_handler(event, context):
         return {"statusCode": 500, "body": f"Error: {str(e)}"}
 
 
+def _tally_deps(dependencies):
+    """Count (direct, transitive, incompatible) dependencies in a single pass."""
+    direct = incompatible = 0
+    for dep in dependencies:
+        if dep.get("direct", True):
+            direct += 1
+        if dep.get("compatible") is False:
+            incompatible += 1
+    return direct, len(dependencies) - direct, incompatible
+
+
 def save_results_to_markdown(result, output_file="result.md"):
     """Save analysis results to a markdown file."""
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(f"# ARM64 호환성 분석 결과\n\n")
-        f.write(f"## 저장소: {result['repository']}\n\n")
+    compatibility_result = result["compatibility_result"]
+    parts = [
+        "# ARM64 호환성 분석 결과\n\n",
+        f"## 저장소: {result['repository']}\n\n",
+    ]
+
+    # 호환성 결과 출력
+    compatibility = compatibility_result["overall_compatibility"]
+    emoji = (
+        "✅"
+        if compatibility == "compatible"
+        else "❓" if compatibility == "unknown" else "❌"
+    )
+    parts.append(f"## 호환성: {emoji} {compatibility}\n\n")
 
-        # 호환성 결과 출력
-        compatibility = result["compatibility_result"]["overall_compatibility"]
-        emoji = (
-            "✅"
-            if compatibility == "compatible"
-            else "❓" if compatibility == "unknown" else "❌"
-        )
-        f.write(f"## 호환성: {emoji} {compatibility}\n\n")
+    # 상세 분석 결과
+    parts.append("## 상세 분석\n\n")
 
-        # 상세 분석 결과
-        f.write("## 상세 분석\n\n")
+    # 인스턴스 타입 및 도커 이미지 분석
+    parts.append(
+        f"- 인스턴스 타입: {len(compatibility_result.get('instance_types', []))} 이슈\n"
+    )
+    parts.append(
+        f"- 도커 이미지: {len(compatibility_result.get('docker_images', []))} 이슈\n"
+    )
 
-        # 인스턴스 타입 및 도커 이미지 분석
-        f.write(
-            f"- 인스턴스 타입: {len(result['compatibility_result'].get('instance_types', []))} 이슈\n"
-        )
-        f.write(
-            f"- 도커 이미지: {len(result['compatibility_result'].get('docker_images', []))} 이슈\n"
-        )
+    # 종속성 분석 상세 정보
+    dependencies = compatibility_result.get("dependencies", [])
+    total_deps = len(dependencies)
+    direct_deps, transitive_deps, incompatible_deps = _tally_deps(dependencies)
 
-        # 종속성 분석 상세 정보
-        dependencies = result["compatibility_result"].get("dependencies", [])
-        total_deps = len(dependencies)
-        direct_deps = sum(1 for dep in dependencies if dep.get("direct", True))
-        transitive_deps = total_deps - direct_deps
-        incompatible_deps = sum(
-            1 for dep in dependencies if dep.get("compatible") is False
-        )
+    parts.append(
+        f"- 종속성: {total_deps} 분석됨 ({direct_deps} 직접, {transitive_deps} 전이적), {incompatible_deps} 이슈\n\n"
+    )
 
-        f.write(
-            f"- 종속성: {total_deps} 분석됨 ({direct_deps} 직접, {transitive_deps} 전이적), {incompatible_deps} 이슈\n\n"
-        )
+    # 권장사항
+    recommendations = compatibility_result.get("recommendations")
+    if recommendations:
+        parts.append("## 권장사항\n\n")
+        parts.extend(f"- {rec}\n" for rec in recommendations)
+        parts.append("\n")
 
-        # 권장사항
-        if result["compatibility_result"].get("recommendations"):
-            f.write("## 권장사항\n\n")
-            for rec in result["compatibility_result"]["recommendations"]:
-                f.write(f"- {rec}\n")
-            f.write("\n")
+    # LLM 평가
+    parts.append("## LLM 평가\n\n")
+    parts.append(f"{result['llm_assessment']}\n")
 
-        # LLM 평가
-        f.write("## LLM 평가\n\n")
-        f.write(f"{result['llm_assessment']}\n")
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write("".join(parts))
 
     print(f"\n결과가 {output_file}에 저장되었습니다.")
 
@@ -272,11 +305,7 @@ if __name__ == "__main__":
             # Enhanced dependency info
             dependencies = result["compatibility_result"].get("dependencies", [])
             total_deps = len(dependencies)
-            direct_deps = sum(1 for dep in dependencies if dep.get("direct", True))
-            transitive_deps = total_deps - direct_deps
-            incompatible_deps = sum(
-                1 for dep in dependencies if dep.get("compatible") is False
-            )
+            direct_deps, transitive_deps, incompatible_deps = _tally_deps(dependencies)
 
             print(
                 f"Dependencies: {total_deps} analyzed ({direct_deps} direct, {transitive_deps} transitive), {incompatible_deps} issues"
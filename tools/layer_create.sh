@@ -11,9 +11,23 @@ usage() {
   echo "  output_filename      Name of the output zip file (default: layer)"
   echo "                       (.zip extension will be added automatically if missing)"
   echo ""
+  echo "Environment:"
+  echo "  LAYER_COMPRESSION    zip compression level 0-9 (default: 9)."
+  echo "                       0 stores files uncompressed, 1 is fastest deflate."
+  echo "  LAYER_STRIP          set to 0 to keep debug symbols in native extensions (default: 1)."
+  echo "  LAYER_COMPILE        set to 1 to ship precompiled bytecode (default: 0)."
+  echo "                       python3 must match the Lambda runtime version, or the .pyc files are ignored."
+  echo "  LAYER_ARCH           target Lambda architecture, x86_64 or arm64. When set, only prebuilt"
+  echo "                       wheels for that platform are installed (no source builds)."
+  echo "  LAYER_PYTHON         target Python version used with LAYER_ARCH (default: 3.13)."
+  echo "  LAYER_FORCE          set to 1 to rebuild even if the inputs are unchanged (default: 0)."
+  echo "                       Needed to pick up new releases of unpinned requirements."
+  echo ""
   echo "Example:"
   echo "  $0 requirements.txt"
   echo "  $0 requirements.txt my-layer"
+  echo "  LAYER_COMPRESSION=1 $0 requirements.txt my-layer"
+  echo "  LAYER_ARCH=arm64 $0 requirements.txt my-layer"
   exit 1
 }
 
@@ -24,6 +38,33 @@ fi
 
 REQ_FILE=$1
 OUTPUT_NAME=${2:-layer}  # Use second argument if provided, otherwise default to "layer"
+LAYER_COMPRESSION=${LAYER_COMPRESSION:-9}  # zip level; lower trades size for build speed
+LAYER_STRIP=${LAYER_STRIP:-1}  # strip shared objects before zipping
+LAYER_COMPILE=${LAYER_COMPILE:-0}  # precompile bytecode so consumers skip it on cold start
+LAYER_ARCH=${LAYER_ARCH:-}  # empty: install for the build machine
+LAYER_PYTHON=${LAYER_PYTHON:-3.13}
+LAYER_FORCE=${LAYER_FORCE:-0}
+
+if [[ ! "$LAYER_COMPRESSION" =~ ^[0-9]$ ]]; then
+  echo "Error: LAYER_COMPRESSION must be a single digit 0-9, got '$LAYER_COMPRESSION'"
+  usage
+fi
+
+# Pin wheels to the target Lambda platform instead of the build machine
+PIP_PLATFORM_ARGS=()
+case "$LAYER_ARCH" in
+  "") ;;
+  x86_64) PIP_PLATFORM=manylinux2014_x86_64 ;;
+  arm64|aarch64) PIP_PLATFORM=manylinux2014_aarch64 ;;
+  *)
+    echo "Error: LAYER_ARCH must be x86_64 or arm64, got '$LAYER_ARCH'"
+    usage
+    ;;
+esac
+if [ -n "$LAYER_ARCH" ]; then
+  PIP_PLATFORM_ARGS=(--platform "$PIP_PLATFORM" --implementation cp
+    --python-version "$LAYER_PYTHON" --only-binary=:all:)
+fi
 
 # Create layer_outputs directory if it doesn't exist
 mkdir -p layer_outputs
@@ -44,14 +85,73 @@ fi
 echo "Using requirements file: $REQ_FILE"
 echo "Output will be saved as: $OUTPUT_FILE"
 
+# Skip the build when the requirements and build settings match the existing zip.
+# Without a target architecture the build machine's Python and architecture are inputs too.
+if command -v sha256sum >/dev/null 2>&1; then
+  SHA256=(sha256sum)
+else
+  SHA256=(shasum -a 256)
+fi
+BUILD_KEY=$(
+  {
+    cat "$REQ_FILE"
+    echo "arch=${LAYER_ARCH:-$(uname -m)} python=$LAYER_PYTHON"
+    [ -z "$LAYER_ARCH" ] && python3 --version
+    echo "compression=$LAYER_COMPRESSION strip=$LAYER_STRIP compile=$LAYER_COMPILE"
+  } | "${SHA256[@]}" | cut -d" " -f1
+)
+BUILD_KEY_FILE="$OUTPUT_FILE.sha256"
+
+if [ "$LAYER_FORCE" != "1" ] && [ -f "$OUTPUT_FILE" ] && [ -f "$BUILD_KEY_FILE" ] \
+  && [ "$(cat "$BUILD_KEY_FILE")" = "$BUILD_KEY" ]; then
+  echo "Layer zip file $OUTPUT_FILE is up to date (build key $BUILD_KEY), skipping build"
+  exit 0
+fi
+
 # Create python directory if it doesn't exist
 mkdir -p python
 
 # Install requirements to the python directory
-pip install -r "$REQ_FILE" -t python/
+if [ -n "$LAYER_ARCH" ]; then
+  echo "Target platform: $PIP_PLATFORM, Python $LAYER_PYTHON"
+fi
+if ! pip install -r "$REQ_FILE" -t python/ "${PIP_PLATFORM_ARGS[@]}"; then
+  echo "Error: pip install failed (with LAYER_ARCH set, a package may have no matching wheel)"
+  rm -rf python/
+  exit 1
+fi
+
+# Strip debug symbols from native extensions to shrink the layer.
+# Failures are ignored: strip cannot handle every object (e.g. another architecture).
+if [ "$LAYER_STRIP" = "1" ]; then
+  if command -v strip >/dev/null 2>&1; then
+    find python -type f -name "*.so*" -exec strip --strip-unneeded {} + 2>/dev/null || true
+  else
+    echo "Warning: strip not found, native extensions are left unstripped"
+  fi
+fi
+
+# Package metadata, type stubs and bundled test suites are not needed at runtime
+ZIP_EXCLUDES=(-x "python/*.dist-info/*" -x "python/*.egg-info/*" -x "*.pyi" -x "python/*/tests/*")
 
-# Create zip file including the python directory itself
-zip -r9 "$OUTPUT_FILE" python -x "*.pyc" -x "python/*.dist-info/*" -x "python/*.egg-info/*"
+if [ "$LAYER_COMPILE" = "1" ]; then
+  # Compile in parallel and keep the resulting __pycache__ directories in the zip
+  echo "Precompiling bytecode with $(python3 --version)"
+  python3 -m compileall -q -j 0 python
+else
+  # Bytecode left over from pip is dropped
+  ZIP_EXCLUDES+=(-x "*.pyc" -x "*/__pycache__/*")
+fi
+
+# Create zip file including the python directory itself.
+# Remove any previous build first, since zip would otherwise update it in place.
+rm -f "$OUTPUT_FILE" "$BUILD_KEY_FILE"
+if ! zip -r"$LAYER_COMPRESSION" "$OUTPUT_FILE" python "${ZIP_EXCLUDES[@]}"; then
+  echo "Error: failed to create $OUTPUT_FILE"
+  rm -rf python/
+  exit 1
+fi
+echo "$BUILD_KEY" > "$BUILD_KEY_FILE"
 
 # Clean up
 rm -rf python/